@@ -60,6 +60,13 @@ struct AddressInfo:
     last_modified: uint256
 
 
+struct AddressEntry:
+    id: uint256
+    addr: address
+    version: uint256
+    last_modified: uint256
+
+
 admin: public(address)
 future_admin: public(address)
 
@@ -81,14 +88,41 @@ def __init__():
 def ids() -> DynArray[uint256, 1000]:
     """
     @notice returns IDs of active registry items in the AddressProvider.
+    @dev IDs are listed in the order they were added, until one is removed:
+         removing an ID moves the last ID into its place.
     @return An array of IDs.
     """
-    _ids: DynArray[uint256, 1000] = []
+    return self._ids
+
+
+@view
+@external
+def get_addresses(_ids: DynArray[uint256, 100]) -> DynArray[AddressEntry, 100]:
+    """
+    @notice Fetch the addresses and metadata associated with several IDs
+    @dev Undefined or unset IDs return an empty address and zero metadata
+    @param _ids Identifiers to fetch addresses for
+    @return An array of entries, in the order of `_ids`
+    """
+    entries: DynArray[AddressEntry, 100] = []
+    for _id in _ids:
+        entries.append(self._get_entry(_id))
+
+    return entries
+
+
+@view
+@external
+def get_all_entries() -> DynArray[AddressEntry, 1000]:
+    """
+    @notice Fetch the addresses and metadata of all active IDs
+    @return An array of entries, in the order of `ids()`
+    """
+    entries: DynArray[AddressEntry, 1000] = []
     for _id in self._ids:
-        if self.check_id_exists[_id]:
-            _ids.append(_id)
+        entries.append(self._get_entry(_id))
 
-    return _ids
+    return entries
 
 
 @view
@@ -103,6 +137,19 @@ def get_address(_id: uint256) -> address:
     return self.get_id_info[_id].addr
 
 
+@view
+@internal
+def _get_entry(_id: uint256) -> AddressEntry:
+    return AddressEntry(
+        {
+            id: _id,
+            addr: self.get_id_info[_id].addr,
+            version: self.get_id_info[_id].version,
+            last_modified: self.get_id_info[_id].last_modified,
+        }
+    )
+
+
 # -------------------------- State-Mutable Methods ---------------------------
 
 
@@ -129,6 +176,17 @@ def _remove_id(_id: uint256) -> bool:
 
     self.check_id_exists[_id] = False
 
+    # Remove ID from the list of active IDs, replacing it with the last one:
+    num_ids: uint256 = len(self._ids)
+    for i in range(1000):
+        if i == num_ids:
+            break
+        if self._ids[i] == _id:
+            last_id: uint256 = self._ids.pop()
+            if i < num_ids - 1:
+                self._ids[i] = last_id
+            break
+
     # Reduce num entries:
     self.num_entries -= 1
 
@@ -268,6 +326,7 @@ def update_description(_id: uint256, _description: String[256]):
 def remove_id(_id: uint256) -> bool:
     """
     @notice Unset an existing identifier
+    @dev Moves the last ID of `ids()` into the position of `_id`
     @param _id Identifier to unset
     @return bool success
     """
@@ -40,6 +40,20 @@ interface RegistryHandler:
     def base_registry() -> address: view
 
 
+# ---- structs ---- #
+struct PoolInfo:
+    coins: address[MAX_COINS]
+    decimals: uint256[MAX_COINS]
+    balances: uint256[MAX_COINS]
+    underlying_coins: address[MAX_COINS]
+    fees: uint256[10]
+    lp_token: address
+    gauge: address
+    is_meta: bool
+    asset_type: uint256
+    name: String[64]
+
+
 # ---- events ---- #
 event CommitNewAdmin:
     deadline: indexed(uint256)
@@ -48,11 +62,45 @@ event CommitNewAdmin:
 event NewAdmin:
     admin: indexed(address)
 
+event PairPoolIndexed:
+    coin_a: indexed(address)
+    coin_b: indexed(address)
+    pool: indexed(address)
+    handler_epoch: uint256
+
+event RegistryHandlerAdded:
+    handler_id: indexed(uint256)
+    registry_handler: indexed(address)
+
+event RegistryHandlerUpdated:
+    handler_id: indexed(uint256)
+    old_registry_handler: indexed(address)
+    registry_handler: indexed(address)
+
+# pools in [previous_pool_count, pool_count) of the handler's pool list are new
+# if the count grew. after RegistryHandlerAdded or RegistryHandlerUpdated,
+# previous_pool_count is 0. registries remove pools by moving their last pool
+# into the removed pool's index, so if the count shrank there is no such range:
+# pools were removed and indices reused, and the handler's pool list has to be
+# read again:
+event PoolCountCheckpoint:
+    handler_id: indexed(uint256)
+    registry_handler: indexed(address)
+    previous_pool_count: uint256
+    pool_count: uint256
+
 
 # ---- constants ---- #
 MAX_REGISTRIES: constant(uint256) = 10
 MAX_COINS: constant(uint256) = 8
 MAX_POOL_PARAMS: constant(uint256) = 20
+MAX_SYNC_POOLS: constant(uint256) = 1000
+MAX_BATCH: constant(uint256) = 100
+MAX_POOL_LIST_RANGE: constant(uint256) = 1000
+MAX_PAIR_POOLS: constant(uint256) = 1000
+MAX_INDEX_POOLS: constant(uint256) = 100
+MAX_HANDLER_RESPONSE: constant(uint256) = 2048
+MAX_CHECKPOINT_POOLS: constant(uint256) = 100
 ADMIN_ACTIONS_DELAY: constant(uint256) = 3 * 86400
 
 
@@ -64,6 +112,30 @@ future_admin: public(address)
 get_registry: public(HashMap[uint256, address])
 registry_length: public(uint256)
 
+# incremented every time a registry handler is added or updated, and when a
+# pool count refresh finds pools removed from a registry handler:
+handler_epoch: public(uint256)
+
+# pool -> bitmap of the indices of the registry handlers the pool is registered in.
+# the upper 128 bits store the handler_epoch the bitmap was synced in:
+pool_handlers: HashMap[address, uint256]
+
+# registry handler index -> number of pools in the handler as of the last refresh:
+handler_pool_count: public(HashMap[uint256, uint256])
+
+# registry handler index -> last pool in the handler's pool list as of the last refresh:
+handler_last_pool: HashMap[uint256, address]
+
+# handler_epoch -> registry handler index -> number of pools indexed by coin pair:
+indexed_pool_count: public(HashMap[uint256, HashMap[uint256, uint256]])
+
+# handler_epoch -> registry handler index -> coin pair key -> pools containing the
+# coin pair, in the order the registry handler returns them:
+pair_pools: HashMap[uint256, HashMap[uint256, HashMap[bytes32, DynArray[address, MAX_PAIR_POOLS]]]]
+
+# handler_epoch -> registry handler index -> coin pair key -> pool -> is in pair_pools:
+is_pair_pool: HashMap[uint256, HashMap[uint256, HashMap[bytes32, HashMap[address, bool]]]]
+
 
 # ---- constructor ---- #
 @external
@@ -78,8 +150,82 @@ def _update_single_registry(_index: uint256, _registry_handler: address):
 
     if _index == self.registry_length:
         self.registry_length += 1
+        log RegistryHandlerAdded(_index, _registry_handler)
+    else:
+        log RegistryHandlerUpdated(_index, self.get_registry[_index], _registry_handler)
+        # every pool of the new handler is new:
+        self.handler_pool_count[_index] = 0
+        self.handler_last_pool[_index] = empty(address)
 
     self.get_registry[_index] = _registry_handler
+    self._update_pool_count(_index)
+
+    # cached pool -> registry handler lookups are stale now:
+    self.handler_epoch += 1
+
+
+@internal
+def _update_pool_count(_index: uint256):
+    # handlers that do not implement `pool_count` are counted as empty:
+    handler: address = self.get_registry[_index]
+    success: bool = False
+    response: Bytes[32] = b""
+    success, response = raw_call(
+        handler,
+        method_id("pool_count()"),
+        max_outsize=32,
+        revert_on_failure=False,
+        is_static_call=True
+    )
+
+    pool_count: uint256 = 0
+    if success and len(response) == 32:
+        pool_count = convert(response, uint256)
+
+    # registries remove a pool by moving their last pool into its place. if the
+    # pool list shrank or its last pool moved, pools were removed and the coin
+    # pair index and cached pool -> registry handler lookups are stale:
+    previous_pool_count: uint256 = self.handler_pool_count[_index]
+    last_pool: address = self.handler_last_pool[_index]
+    epoch: uint256 = self.handler_epoch
+    if pool_count < previous_pool_count:
+        epoch += 1
+    elif previous_pool_count > 0:
+        if RegistryHandler(handler).pool_list(previous_pool_count - 1) != last_pool:
+            epoch += 1
+
+    # new pools may already be cached with other registry handlers:
+    if epoch == self.handler_epoch and pool_count > previous_pool_count:
+        if pool_count - previous_pool_count > MAX_CHECKPOINT_POOLS:
+            epoch += 1
+        else:
+            for i in range(previous_pool_count, previous_pool_count + MAX_CHECKPOINT_POOLS):
+                if i == pool_count:
+                    break
+                pool: address = RegistryHandler(handler).pool_list(i)
+                cached: uint256 = self.pool_handlers[pool]
+                if cached >> 128 == epoch:
+                    self.pool_handlers[pool] = cached | (1 << _index)
+
+    self.handler_epoch = epoch
+
+    if pool_count != previous_pool_count:
+        self.handler_pool_count[_index] = pool_count
+        log PoolCountCheckpoint(_index, handler, previous_pool_count, pool_count)
+
+    if pool_count > 0:
+        last_pool = RegistryHandler(handler).pool_list(pool_count - 1)
+    else:
+        last_pool = empty(address)
+    self.handler_last_pool[_index] = last_pool
+
+
+@internal
+def _update_pool_counts():
+    for i in range(MAX_REGISTRIES):
+        if i == self.registry_length:
+            break
+        self._update_pool_count(i)
 
 
 @internal
@@ -95,6 +241,59 @@ def _get_pool_from_lp_token(_token: address) -> address:
     return empty(address)
 
 
+@internal
+@view
+def _scan_registry_handlers(_pool: address) -> uint256:
+    bitmap: uint256 = 0
+    for i in range(MAX_REGISTRIES):
+
+        if i == self.registry_length:
+            break
+        handler: address = self.get_registry[i]
+
+        if RegistryHandler(handler).is_registered(_pool):
+            bitmap |= 1 << i
+
+    return bitmap
+
+
+@internal
+@view
+def _is_registered_in_handlers(_pool: address, _bitmap: uint256) -> bool:
+    if _bitmap == 0:
+        return False
+
+    for i in range(MAX_REGISTRIES):
+
+        if i == self.registry_length:
+            break
+
+        if _bitmap & (1 << i) != 0 and not RegistryHandler(self.get_registry[i]).is_registered(_pool):
+            return False
+
+    return True
+
+
+@internal
+@view
+def _get_pool_handler_bitmap(_pool: address) -> uint256:
+    """
+    @notice Get the indices of the registry handlers a pool is registered in
+    @dev Reads the cache filled by `sync_pools` if it is up to date with the
+         current registry handlers and every cached handler still has the
+         pool, and scans all registry handlers otherwise
+    @param _pool address of the pool
+    @return bitmap with bit `i` set if the pool is registered in handler `i`
+    """
+    cached: uint256 = self.pool_handlers[_pool]
+    if cached >> 128 == self.handler_epoch:
+        bitmap: uint256 = cached % 2**128
+        # pools removed from a registry stay in the cache until resynced:
+        if self._is_registered_in_handlers(_pool, bitmap):
+            return bitmap
+    return self._scan_registry_handlers(_pool)
+
+
 @internal
 @view
 def _get_registry_handlers_from_pool(_pool: address) -> address[MAX_REGISTRIES]:
@@ -108,16 +307,16 @@ def _get_registry_handlers_from_pool(_pool: address) -> address[MAX_REGISTRIES]:
     @return registry_handlers: address[MAX_REGISTRIES]
     """
 
+    bitmap: uint256 = self._get_pool_handler_bitmap(_pool)
     pool_registry_handler: address[MAX_REGISTRIES] = empty(address[MAX_REGISTRIES])
     c: uint256 = 0
     for i in range(MAX_REGISTRIES):
 
         if i == self.registry_length:
             break
-        handler: address = self.get_registry[i]
 
-        if RegistryHandler(handler).is_registered(_pool):
-            pool_registry_handler[c] = handler
+        if bitmap & (1 << i) != 0:
+            pool_registry_handler[c] = self.get_registry[i]
             c += 1
 
     if pool_registry_handler[0] == empty(address):
@@ -125,6 +324,188 @@ def _get_registry_handlers_from_pool(_pool: address) -> address[MAX_REGISTRIES]:
     return pool_registry_handler
 
 
+@internal
+@view
+def _get_first_registry_handler(_pool: address) -> address:
+    bitmap: uint256 = self._get_pool_handler_bitmap(_pool)
+    for i in range(MAX_REGISTRIES):
+
+        if i == self.registry_length:
+            break
+
+        if bitmap & (1 << i) != 0:
+            return self.get_registry[i]
+
+    return empty(address)
+
+
+@internal
+@view
+def _try_handler_call(
+    _handler: address, _method_id: Bytes[4], _arg: address
+) -> (bool, Bytes[32 * MAX_COINS]):
+    """
+    @notice Call a `method(address)` getter of a registry handler without reverting
+    @param _handler address of the registry handler
+    @param _method_id method id of the getter
+    @param _arg address argument of the getter
+    @return success of the call, raw response of the getter
+    """
+    if _handler == empty(address):
+        return False, b""
+
+    success: bool = False
+    response: Bytes[32 * MAX_COINS] = b""
+    success, response = raw_call(
+        _handler,
+        concat(_method_id, convert(_arg, bytes32)),
+        max_outsize=32 * MAX_COINS,
+        revert_on_failure=False,
+        is_static_call=True
+    )
+    return success, response
+
+
+@internal
+@view
+def _get_balances_many(
+    _pools: DynArray[address, MAX_BATCH], _method_id: Bytes[4]
+) -> (DynArray[bool, MAX_BATCH], DynArray[uint256[MAX_COINS], MAX_BATCH]):
+    successes: DynArray[bool, MAX_BATCH] = []
+    balances: DynArray[uint256[MAX_COINS], MAX_BATCH] = []
+
+    success: bool = False
+    response: Bytes[32 * MAX_COINS] = b""
+    for pool in _pools:
+
+        success, response = self._try_handler_call(
+            self._get_first_registry_handler(pool), _method_id, pool
+        )
+
+        if success and len(response) == 32 * MAX_COINS:
+            successes.append(True)
+            balances.append(_abi_decode(response, uint256[MAX_COINS]))
+        else:
+            successes.append(False)
+            balances.append(empty(uint256[MAX_COINS]))
+
+    return successes, balances
+
+
+@internal
+@pure
+def _get_pair_key(_coin_a: address, _coin_b: address) -> bytes32:
+    if convert(_coin_a, uint256) < convert(_coin_b, uint256):
+        return keccak256(concat(convert(_coin_a, bytes32), convert(_coin_b, bytes32)))
+    return keccak256(concat(convert(_coin_b, bytes32), convert(_coin_a, bytes32)))
+
+
+@internal
+def _add_pair_pool(
+    _epoch: uint256, _handler_id: uint256, _key: bytes32, _coin_a: address, _coin_b: address, _pool: address
+):
+    if self.is_pair_pool[_epoch][_handler_id][_key][_pool]:
+        return
+
+    self.is_pair_pool[_epoch][_handler_id][_key][_pool] = True
+    self.pair_pools[_epoch][_handler_id][_key].append(_pool)
+    log PairPoolIndexed(_coin_a, _coin_b, _pool, _epoch)
+
+
+@internal
+def _index_pair(
+    _epoch: uint256, _handler_id: uint256, _handler: address, _coin_a: address, _coin_b: address, _pool: address
+):
+    if _coin_a == empty(address) or _coin_b == empty(address) or _coin_a == _coin_b:
+        return
+
+    key: bytes32 = self._get_pair_key(_coin_a, _coin_b)
+
+    # the first time a pair is indexed, copy the handler's own list of pools
+    # for the pair so that lookups return pools in the same order as the scan:
+    if len(self.pair_pools[_epoch][_handler_id][key]) == 0:
+        for i in range(MAX_PAIR_POOLS):
+            pool: address = RegistryHandler(_handler).find_pool_for_coins(_coin_a, _coin_b, i)
+            if pool == empty(address):
+                break
+            self._add_pair_pool(_epoch, _handler_id, key, _coin_a, _coin_b, pool)
+
+    self._add_pair_pool(_epoch, _handler_id, key, _coin_a, _coin_b, _pool)
+
+
+@internal
+def _index_pool(_epoch: uint256, _handler_id: uint256, _handler: address, _pool: address):
+    """
+    @notice Add a pool to the coin pair index
+    @dev Indexes every pair of coins and every pair of underlying coins. For
+         metapools, pairs of two base pool coins are skipped, the same way
+         the registries do
+    @param _epoch current handler_epoch
+    @param _handler_id index of the registry handler listing the pool
+    @param _handler address of the registry handler listing the pool
+    @param _pool address of the pool
+    """
+    coins: address[MAX_COINS] = RegistryHandler(_handler).get_coins(_pool)
+    for i in range(MAX_COINS):
+        if coins[i] == empty(address):
+            break
+        for j in range(MAX_COINS):
+            if j <= i:
+                continue
+            self._index_pair(_epoch, _handler_id, _handler, coins[i], coins[j], _pool)
+
+    # pairs that are also coin pairs are skipped by `_index_pair`:
+    underlying_coins: address[MAX_COINS] = RegistryHandler(_handler).get_underlying_coins(_pool)
+
+    # underlying coins at or above this index belong to the base pool:
+    base_coin_offset: uint256 = MAX_COINS
+    if RegistryHandler(_handler).is_meta(_pool):
+        base_coin_offset = RegistryHandler(_handler).get_n_coins(_pool) - 1
+
+    for i in range(MAX_COINS):
+        if underlying_coins[i] == empty(address) or i >= base_coin_offset:
+            break
+        for j in range(MAX_COINS):
+            if j <= i:
+                continue
+            self._index_pair(_epoch, _handler_id, _handler, underlying_coins[i], underlying_coins[j], _pool)
+
+
+@internal
+@view
+def _is_pair_index_complete() -> bool:
+    """
+    @notice Check if every pool of every registry handler is in the coin pair index
+    @dev Uses the pool counts cached by `checkpoint`
+    """
+    if self.registry_length == 0:
+        return False
+
+    epoch: uint256 = self.handler_epoch
+    for i in range(MAX_REGISTRIES):
+        if i == self.registry_length:
+            break
+        if self.indexed_pool_count[epoch][i] < self.handler_pool_count[i]:
+            return False
+
+    return True
+
+
+@internal
+@view
+def _get_pair_pool(_key: bytes32, _i: uint256) -> address:
+    epoch: uint256 = self.handler_epoch
+    i: uint256 = _i
+    for handler_id in range(MAX_REGISTRIES):
+        if handler_id == self.registry_length:
+            break
+        num_pools: uint256 = len(self.pair_pools[epoch][handler_id][_key])
+        if i < num_pools:
+            return self.pair_pools[epoch][handler_id][_key][i]
+        i -= num_pools
+    return empty(address)
+
+
 # ---- most used methods: Admin / DAO privileged methods ---- #
 @external
 def add_registry_handler(_registry_handler: address):
@@ -150,6 +531,96 @@ def update_registry_handler(_index: uint256, _registry_handler: address):
     self._update_single_registry(_index, _registry_handler)
 
 
+@external
+def checkpoint():
+    """
+    @notice Record the number of pools in every registry handler and log
+            the pools added since the last checkpoint
+    @dev Permissionless. Logs `PoolCountCheckpoint` for every handler whose
+         pool count changed, so indexers can read the new pools from the
+         handler's pool list instead of rescanning every handler. `pool_count`,
+         `pool_list`, `pool_list_range` and the coin pair index only see pools
+         counted by the last checkpoint. New pools are added to the cached
+         registry handlers of pools synced with other handlers, and removed
+         pools reset the cached registry handlers and the coin pair index
+    """
+    self._update_pool_counts()
+
+
+@external
+def index_pools(_handler_id: uint256, _start: uint256, _count: uint256):
+    """
+    @notice Add a range of pools listed by a registry handler to the coin pair index
+    @dev Permissionless. Pools have to be indexed in the order of the handler's
+         pool list, and indexing restarts from scratch when a registry handler
+         is added or updated or when `checkpoint` finds pools removed
+         from a handler. `find_pool_for_coins`, `find_pools_for_coins` and
+         `get_pool_count_for_coins` answer from the index, in the same order as
+         the handlers, once every pool counted by the last `checkpoint`
+         is indexed, and scan the handlers until then
+    @param _handler_id Index of the registry handler listing the pools
+    @param _start Index of the first pool in the handler's pool list
+    @param _count Number of pools to index
+    """
+    assert _handler_id < self.registry_length  # dev: invalid handler id
+
+    epoch: uint256 = self.handler_epoch
+    assert _start == self.indexed_pool_count[epoch][_handler_id]  # dev: pools must be indexed in order
+
+    handler: address = self.get_registry[_handler_id]
+    pool_count: uint256 = RegistryHandler(handler).pool_count()
+
+    pool_index: uint256 = _start
+    for i in range(MAX_INDEX_POOLS):
+
+        if i == _count or pool_index == pool_count:
+            break
+
+        self._index_pool(epoch, _handler_id, handler, RegistryHandler(handler).pool_list(pool_index))
+        pool_index += 1
+
+    self.indexed_pool_count[epoch][_handler_id] = pool_index
+
+
+@external
+def sync_pools(_handler_id: uint256, _start: uint256, _count: uint256):
+    """
+    @notice Cache the registry handlers of a range of pools listed by a handler
+    @dev Permissionless. Getters resolve the handlers of synced pools from storage
+         and only call `is_registered` on the cached handlers instead of on
+         every handler. Pools have to be synced again after a registry handler
+         is added or updated
+    @param _handler_id Index of the registry handler listing the pools
+    @param _start Index of the first pool in the handler's pool list
+    @param _count Number of pools to sync
+    """
+    assert _handler_id < self.registry_length  # dev: invalid handler id
+
+    handler: address = self.get_registry[_handler_id]
+    pool_count: uint256 = RegistryHandler(handler).pool_count()
+    epoch: uint256 = self.handler_epoch << 128
+
+    for i in range(MAX_SYNC_POOLS):
+
+        if i == _count or _start + i >= pool_count:
+            break
+
+        pool: address = RegistryHandler(handler).pool_list(_start + i)
+        self.pool_handlers[pool] = epoch | self._scan_registry_handlers(pool)
+
+
+@external
+def sync_pool(_pool: address):
+    """
+    @notice Cache the registry handlers of a single pool
+    @dev Permissionless. Use it for pools that were added to another registry
+         handler after they were synced, or that are no longer listed by the
+         handler they were synced from
+    @param _pool Pool address
+    """
+    self.pool_handlers[_pool] = (self.handler_epoch << 128) | self._scan_registry_handlers(_pool)
+
+
 # ---- view methods (API) of the contract ---- #
 
 
@@ -164,6 +635,29 @@ def get_registry_handlers_from_pool(_pool: address) -> address[MAX_REGISTRIES]:
     return self._get_registry_handlers_from_pool(_pool)
 
 
+@external
+@view
+def call_handler(
+    _handler_index: uint256, _selector: bytes4, _pool: address
+) -> Bytes[MAX_HANDLER_RESPONSE]:
+    """
+    @notice Call a `method(address)` getter of a known registry handler
+    @dev Skips resolving the pool's registry handlers: use it when the handler
+         owning `_pool` is already known. Reverts if the handler call reverts
+    @param _handler_index Index of the registry handler
+    @param _selector Method id of the getter, e.g. `get_balances(address)`
+    @param _pool Pool address
+    @return ABI encoded response of the getter
+    """
+    assert _handler_index < self.registry_length  # dev: invalid handler index
+    return raw_call(
+        self.get_registry[_handler_index],
+        concat(_selector, convert(_pool, bytes32)),
+        max_outsize=MAX_HANDLER_RESPONSE,
+        is_static_call=True
+    )
+
+
 @external
 @view
 def get_base_registry(registry_handler: address) -> address:
@@ -187,6 +681,9 @@ def find_pool_for_coins(
     @param i Index of the pool to return
     @return Pool address
     """
+    if self._is_pair_index_complete():
+        return self._get_pair_pool(self._get_pair_key(_from, _to), i)
+
     pools_found: uint256 = 0
     pool: address = empty(address)
     registry: address = empty(address)
@@ -219,6 +716,18 @@ def find_pools_for_coins(_from: address, _to: address) -> DynArray[address, 1000
     @return Pool addresses
     """
     pools_found: DynArray[address, 1000]= empty(DynArray[address, 1000])
+
+    if self._is_pair_index_complete():
+        epoch: uint256 = self.handler_epoch
+        key: bytes32 = self._get_pair_key(_from, _to)
+        for handler_id in range(MAX_REGISTRIES):
+            if handler_id == self.registry_length:
+                break
+            handler_pools: DynArray[address, MAX_PAIR_POOLS] = self.pair_pools[epoch][handler_id][key]
+            for indexed_pool in handler_pools:
+                pools_found.append(indexed_pool)
+        return pools_found
+
     pool: address = empty(address)
     registry: address = empty(address)
 
@@ -238,6 +747,91 @@ def find_pools_for_coins(_from: address, _to: address) -> DynArray[address, 1000
     return pools_found
 
 
+@view
+@external
+def find_pools_for_coins_paginated(
+    _from: address, _to: address, _offset: uint256, _limit: uint256
+) -> (DynArray[address, 1000], uint256):
+    """
+    @notice Find a page of the pools that contain the input pair
+    @dev The offset is a cursor: use 0 for the first page and the returned
+         cursor for the following pages. The returned cursor is 0 once there
+         are no more pools to find
+    @param _from Address of coin to be sent
+    @param _to Address of coin to be received
+    @param _offset Cursor of the first pool in the page
+    @param _limit Maximum number of pools in the page
+    @return Pool addresses, cursor of the next page
+    """
+    assert _limit > 0 and _limit <= 1000  # dev: invalid limit
+
+    pools_found: DynArray[address, 1000] = empty(DynArray[address, 1000])
+    pool: address = empty(address)
+
+    # the cursor packs the registry handler index in the upper 128 bits
+    # and the index of the pool in the handler in the lower 128 bits:
+    registry_index: uint256 = _offset >> 128
+    j: uint256 = _offset % 2**128
+
+    for i in range(MAX_REGISTRIES):
+
+        if registry_index >= self.registry_length:
+            break
+        registry: address = self.get_registry[registry_index]
+
+        for k in range(0, 65536):
+
+            pool = RegistryHandler(registry).find_pool_for_coins(_from, _to, j)
+            if pool == empty(address):
+                break
+
+            if len(pools_found) == _limit:
+                return pools_found, (registry_index << 128) | j
+
+            pools_found.append(pool)
+            j += 1
+
+        registry_index += 1
+        j = 0
+
+    return pools_found, 0
+
+
+@view
+@external
+def get_pool_count_for_coins(_from: address, _to: address) -> uint256:
+    """
+    @notice Count the pools that contain the input pair
+    @param _from Address of coin to be sent
+    @param _to Address of coin to be received
+    @return Number of pools
+    """
+    pools_found: uint256 = 0
+
+    if self._is_pair_index_complete():
+        epoch: uint256 = self.handler_epoch
+        key: bytes32 = self._get_pair_key(_from, _to)
+        for handler_id in range(MAX_REGISTRIES):
+            if handler_id == self.registry_length:
+                break
+            pools_found += len(self.pair_pools[epoch][handler_id][key])
+        return pools_found
+
+    for registry_index in range(MAX_REGISTRIES):
+
+        if registry_index == self.registry_length:
+            break
+        registry: address = self.get_registry[registry_index]
+
+        for j in range(0, 65536):
+
+            if RegistryHandler(registry).find_pool_for_coins(_from, _to, j) == empty(address):
+                break
+            pools_found += 1
+
+    return pools_found
+
+
 @external
 @view
 def get_admin_balances(_pool: address, _handler_id: uint256 = 0) -> uint256[MAX_COINS]:
@@ -264,6 +858,201 @@ def get_balances(_pool: address, _handler_id: uint256 = 0)  -> uint256[MAX_COINS
     return RegistryHandler(self._get_registry_handlers_from_pool(_pool)[_handler_id]).get_balances(_pool)
 
 
+@external
+@view
+def get_gauges_many(
+    _pools: DynArray[address, MAX_BATCH]
+) -> (DynArray[bool, MAX_BATCH], DynArray[address, MAX_BATCH], DynArray[int128, MAX_BATCH]):
+    """
+    @notice Get the first liquidity gauge and its gauge_type for a list of pools
+    @dev Uses the first registry handler of each pool. Failed queries are
+         flagged the same way as in `get_balances_many`
+    @param _pools List of pool addresses
+    @return List of success flags, list of gauges, list of gauge types
+    """
+    successes: DynArray[bool, MAX_BATCH] = []
+    gauges: DynArray[address, MAX_BATCH] = []
+    types: DynArray[int128, MAX_BATCH] = []
+
+    success: bool = False
+    response: Bytes[640] = b""
+    for pool in _pools:
+
+        handler: address = self._get_first_registry_handler(pool)
+        if handler == empty(address):
+            successes.append(False)
+            gauges.append(empty(address))
+            types.append(0)
+            continue
+
+        success, response = raw_call(
+            handler,
+            concat(method_id("get_gauges(address)"), convert(pool, bytes32)),
+            max_outsize=640,
+            revert_on_failure=False,
+            is_static_call=True
+        )
+
+        if success and len(response) == 640:
+            pool_gauges: address[10] = empty(address[10])
+            pool_types: int128[10] = empty(int128[10])
+            pool_gauges, pool_types = _abi_decode(response, (address[10], int128[10]))
+            successes.append(True)
+            gauges.append(pool_gauges[0])
+            types.append(pool_types[0])
+        else:
+            successes.append(False)
+            gauges.append(empty(address))
+            types.append(0)
+
+    return successes, gauges, types
+
+
+@external
+@view
+def get_balances_many(
+    _pools: DynArray[address, MAX_BATCH]
+) -> (DynArray[bool, MAX_BATCH], DynArray[uint256[MAX_COINS], MAX_BATCH]):
+    """
+    @notice Get balances for each coin within a list of pools
+    @dev Uses the first registry handler of each pool. A pool that is not
+         registered or whose query reverts gets a False success flag and
+         empty balances instead of reverting the whole batch
+    @param _pools List of pool addresses
+    @return List of success flags, list of balances
+    """
+    return self._get_balances_many(_pools, method_id("get_balances(address)"))
+
+
+@external
+@view
+def get_underlying_balances_many(
+    _pools: DynArray[address, MAX_BATCH]
+) -> (DynArray[bool, MAX_BATCH], DynArray[uint256[MAX_COINS], MAX_BATCH]):
+    """
+    @notice Get balances for each underlying coin within a list of pools
+    @dev Pools are grouped by their first registry handler and each handler
+         is queried once with `get_underlying_balances_many`, which lets
+         factory handlers read shared base pools once. When a handler's batch
+         query reverts, its pools are queried one by one. Failed queries are
+         flagged the same way as in `get_balances_many`
+    @param _pools List of pool addresses
+    @return List of success flags, list of underlying balances
+    """
+    successes: DynArray[bool, MAX_BATCH] = []
+    balances: DynArray[uint256[MAX_COINS], MAX_BATCH] = []
+    pool_handlers: DynArray[address, MAX_BATCH] = []
+    for pool in _pools:
+        successes.append(False)
+        balances.append(empty(uint256[MAX_COINS]))
+        pool_handlers.append(self._get_first_registry_handler(pool))
+
+    success: bool = False
+    response: Bytes[64 + 32 * MAX_COINS * MAX_BATCH] = b""
+    for handler_id in range(MAX_REGISTRIES):
+
+        if handler_id == self.registry_length:
+            break
+        handler: address = self.get_registry[handler_id]
+
+        handler_pools: DynArray[address, MAX_BATCH] = []
+        for k in range(len(_pools), bound=MAX_BATCH):
+            if pool_handlers[k] == handler:
+                handler_pools.append(_pools[k])
+
+        if len(handler_pools) == 0:
+            continue
+
+        handler_balances: DynArray[uint256[MAX_COINS], MAX_BATCH] = []
+        success, response = raw_call(
+            handler,
+            _abi_encode(handler_pools, method_id=method_id("get_underlying_balances_many(address[])")),
+            max_outsize=64 + 32 * MAX_COINS * MAX_BATCH,
+            revert_on_failure=False,
+            is_static_call=True
+        )
+        if success and len(response) == 64 + 32 * MAX_COINS * len(handler_pools):
+            handler_balances = _abi_decode(response, DynArray[uint256[MAX_COINS], MAX_BATCH])
+
+        n: uint256 = 0
+        for k in range(len(_pools), bound=MAX_BATCH):
+
+            if pool_handlers[k] != handler:
+                continue
+
+            if len(handler_balances) == len(handler_pools):
+                successes[k] = True
+                balances[k] = handler_balances[n]
+            else:
+                pool_response: Bytes[32 * MAX_COINS] = b""
+                success, pool_response = self._try_handler_call(
+                    handler, method_id("get_underlying_balances(address)"), _pools[k]
+                )
+                if success and len(pool_response) == 32 * MAX_COINS:
+                    successes[k] = True
+                    balances[k] = _abi_decode(pool_response, uint256[MAX_COINS])
+
+            pool_handlers[k] = empty(address)
+            n += 1
+
+    return successes, balances
+
+
+@external
+@view
+def get_admin_balances_many(
+    _pools: DynArray[address, MAX_BATCH]
+) -> (DynArray[bool, MAX_BATCH], DynArray[uint256[MAX_COINS], MAX_BATCH]):
+    """
+    @notice Get the current admin balances (uncollected fees) for a list of pools
+    @dev Failed queries are flagged the same way as in `get_balances_many`
+    @param _pools List of pool addresses
+    @return List of success flags, list of admin balances
+    """
+    return self._get_balances_many(_pools, method_id("get_admin_balances(address)"))
+
+
+@external
+@view
+def get_virtual_prices_many(
+    _pools: DynArray[address, MAX_BATCH]
+) -> (DynArray[bool, MAX_BATCH], DynArray[uint256, MAX_BATCH]):
+    """
+    @notice Get the virtual price of the LP token of each pool in a list of pools
+    @dev Failed queries are flagged the same way as in `get_balances_many`
+    @param _pools List of pool addresses
+    @return List of success flags, list of virtual prices
+    """
+    successes: DynArray[bool, MAX_BATCH] = []
+    virtual_prices: DynArray[uint256, MAX_BATCH] = []
+
+    handler: address = empty(address)
+    success: bool = False
+    response: Bytes[32 * MAX_COINS] = b""
+    for pool in _pools:
+
+        handler = self._get_first_registry_handler(pool)
+        success, response = self._try_handler_call(
+            handler, method_id("get_lp_token(address)"), pool
+        )
+
+        if success and len(response) == 32:
+            success, response = self._try_handler_call(
+                handler,
+                method_id("get_virtual_price_from_lp_token(address)"),
+                _abi_decode(response, address)
+            )
+
+        if success and len(response) == 32:
+            successes.append(True)
+            virtual_prices.append(_abi_decode(response, uint256))
+        else:
+            successes.append(False)
+            virtual_prices.append(0)
+
+    return successes, virtual_prices
+
+
 @external
 @view
 def get_base_pool(_pool: address, _handler_id: uint256 = 0) -> address:
@@ -364,6 +1153,26 @@ def get_gauge_type(_pool: address, gauge_idx: uint256 = 0, _handler_id: uint256
     return handler_output[gauge_idx]
 
 
+@external
+@view
+def get_gauge_and_type(
+    _pool: address, gauge_idx: uint256 = 0, _handler_id: uint256 = 0
+) -> (address, int128):
+    """
+    @notice Get a single liquidity gauge contract and its gauge_type
+    @dev Resolves both with one `get_gauges` query to the registry handler
+    @param _pool Pool address
+    @param gauge_idx Index of gauge to return
+    @param _handler_id id of registry handler
+    @return Address of gauge, gauge_type of gauge
+    """
+    registry_handler: RegistryHandler = RegistryHandler(self._get_registry_handlers_from_pool(_pool)[_handler_id])
+    gauges: address[10] = empty(address[10])
+    types: int128[10] = empty(int128[10])
+    gauges, types = registry_handler.get_gauges(_pool)
+    return gauges[gauge_idx], types[gauge_idx]
+
+
 @external
 @view
 def get_lp_token(_pool: address, _handler_id: uint256 = 0) -> address:
@@ -423,6 +1232,54 @@ def get_pool_from_lp_token(_token: address, _handler_id: uint256 = 0) -> address
     return self._get_pool_from_lp_token(_token)
 
 
+@external
+@view
+def get_pool_info(_pool: address, _handler_id: uint256 = 0) -> PoolInfo:
+    """
+    @notice Get the coins, balances, fees and metadata of a pool in one call
+    @dev Uses the handler's `get_pool_info` if it has one, and queries the
+         handler's individual getters otherwise. Reverts with the handler's
+         error if its `get_pool_info` reverts. Gauge types are not included
+    @param _pool Pool address
+    @param _handler_id id of registry handler
+    @return PoolInfo struct of the pool
+    """
+    registry_handler: address = self._get_registry_handlers_from_pool(_pool)[_handler_id]
+
+    success: bool = False
+    response: Bytes[1632] = b""
+    success, response = raw_call(
+        registry_handler,
+        concat(
+            method_id("get_pool_info(address)"),
+            convert(_pool, bytes32),
+        ),
+        max_outsize=1632,
+        revert_on_failure=False,
+        is_static_call=True
+    )
+    if success and len(response) > 0:
+        return _abi_decode(response, PoolInfo)
+
+    # handlers without `get_pool_info` revert without data, or return nothing
+    # from a fallback function. anything else is an error of the handler:
+    if not success and len(response) > 0:
+        raw_revert(response)
+
+    return PoolInfo({
+        coins: RegistryHandler(registry_handler).get_coins(_pool),
+        decimals: RegistryHandler(registry_handler).get_decimals(_pool),
+        balances: RegistryHandler(registry_handler).get_balances(_pool),
+        underlying_coins: RegistryHandler(registry_handler).get_underlying_coins(_pool),
+        fees: RegistryHandler(registry_handler).get_fees(_pool),
+        lp_token: RegistryHandler(registry_handler).get_lp_token(_pool),
+        gauge: RegistryHandler(registry_handler).get_gauges(_pool)[0][0],
+        is_meta: RegistryHandler(registry_handler).is_meta(_pool),
+        asset_type: RegistryHandler(registry_handler).get_pool_asset_type(_pool),
+        name: RegistryHandler(registry_handler).get_pool_name(_pool),
+    })
+
+
 @external
 @view
 def get_pool_params(_pool: address, _handler_id: uint256 = 0) -> uint256[MAX_POOL_PARAMS]:
@@ -529,14 +1386,14 @@ def is_registered(_pool: address, _handler_id: uint256 = 0) -> bool:
 def pool_count() -> uint256:
     """
     @notice Return the total number of pools tracked by the metaregistry
+    @dev Uses the pool counts cached by `checkpoint`
     @return uint256 The number of pools in the metaregistry
     """
     total_pools: uint256 = 0
     for i in range(MAX_REGISTRIES):
         if i == self.registry_length:
             break
-        handler: address = self.get_registry[i]
-        total_pools += RegistryHandler(handler).pool_count()
+        total_pools += self.handler_pool_count[i]
     return total_pools
 
 
@@ -545,6 +1402,9 @@ def pool_count() -> uint256:
 def pool_list(_index: uint256) -> address:
     """
     @notice Return the pool at a given index in the metaregistry
+    @dev Uses the pool counts cached by `checkpoint`. Returns
+         empty(address) for indices past the current pool count of a handler
+         whose count shrank since the last refresh
     @param _index The index of the pool in the metaregistry
     @return The address of the pool at the given index
     """
@@ -552,14 +1412,58 @@ def pool_list(_index: uint256) -> address:
     for i in range(MAX_REGISTRIES):
         if i == self.registry_length:
             break
-        handler: address = self.get_registry[i]
-        count: uint256 = RegistryHandler(handler).pool_count()
+        count: uint256 = self.handler_pool_count[i]
         if _index - pools_skip < count:
+            handler: address = self.get_registry[i]
+            if _index - pools_skip >= RegistryHandler(handler).pool_count():
+                return empty(address)
             return RegistryHandler(handler).pool_list(_index - pools_skip)
         pools_skip += count
     return empty(address)
 
 
+@external
+@view
+def pool_list_range(_start: uint256, _count: uint256) -> DynArray[address, MAX_POOL_LIST_RANGE]:
+    """
+    @notice Return a range of pools in the metaregistry
+    @dev Uses the pool counts cached by `checkpoint`. The range is
+         cut short if it goes past the last pool. Pools past the current pool
+         count of a handler whose count shrank since the last refresh are
+         returned as empty(address), the same as in `pool_list`
+    @param _start The index of the first pool in the metaregistry
+    @param _count The number of pools to return
+    @return The addresses of the pools in the range
+    """
+    assert _count <= MAX_POOL_LIST_RANGE  # dev: count exceeds max
+
+    pools: DynArray[address, MAX_POOL_LIST_RANGE] = []
+    pools_skip: uint256 = 0
+    for i in range(MAX_REGISTRIES):
+        if i == self.registry_length or len(pools) == _count:
+            break
+
+        count: uint256 = self.handler_pool_count[i]
+        if _start + len(pools) - pools_skip >= count:
+            pools_skip += count
+            continue
+
+        handler: address = self.get_registry[i]
+        live_count: uint256 = RegistryHandler(handler).pool_count()
+        for j in range(MAX_POOL_LIST_RANGE):
+            index: uint256 = _start + len(pools) - pools_skip
+            if index >= count or len(pools) == _count:
+                break
+            if index < live_count:
+                pools.append(RegistryHandler(handler).pool_list(index))
+            else:
+                pools.append(empty(address))
+
+        pools_skip += count
+
+    return pools
+
+
 @external
 def commit_transfer_ownership(_addr: address):
     """
@@ -42,6 +42,20 @@ interface GaugeFactory:
     def get_gauge_from_lp_token(_lp_token: address) -> address: view
 
 
+# ---- structs ---- #
+struct PoolInfo:
+    coins: address[MAX_COINS]
+    decimals: uint256[MAX_COINS]
+    balances: uint256[MAX_COINS]
+    underlying_coins: address[MAX_COINS]
+    fees: uint256[10]
+    lp_token: address
+    gauge: address
+    is_meta: bool
+    asset_type: uint256
+    name: String[64]
+
+
 # ---- events ---- #
 event CommitNewAdmin:
     deadline: indexed(uint256)
@@ -55,6 +69,7 @@ event NewAdmin:
 MAX_REGISTRIES: constant(uint256) = 10
 MAX_COINS: constant(uint256) = 8
 MAX_POOL_PARAMS: constant(uint256) = 20
+MAX_BATCH: constant(uint256) = 100
 ADMIN_ACTIONS_DELAY: constant(uint256) = 3 * 86400
 
 
@@ -68,6 +83,9 @@ registry_length: public(uint256)
 gauge_factory: public(GaugeFactory)
 gauge_type: public(int128)
 
+# gauge factory -> lp token -> gauge, filled by `cache_gauges`:
+cached_gauge: HashMap[address, HashMap[address, address]]
+
 
 # ---- constructor ---- #
 @external
@@ -131,6 +149,54 @@ def _get_registry_handlers_from_pool(_pool: address) -> address[MAX_REGISTRIES]:
     return pool_registry_handler
 
 
+@internal
+@view
+def _get_first_registry_handler(_pool: address) -> address:
+    for i in range(MAX_REGISTRIES):
+
+        if i == self.registry_length:
+            break
+        handler: address = self.get_registry[i]
+
+        if RegistryHandler(handler).is_registered(_pool):
+            return handler
+
+    return empty(address)
+
+
+@internal
+@view
+def _get_gauge(_gauge_factory: address, _lp_token: address) -> address:
+    gauge: address = self.cached_gauge[_gauge_factory][_lp_token]
+    if gauge == empty(address):
+        gauge = GaugeFactory(_gauge_factory).get_gauge_from_lp_token(_lp_token)
+    return gauge
+
+
+@internal
+@view
+def _try_address_call(_target: address, _method_id: Bytes[4], _arg: address) -> (bool, address):
+    """
+    @notice Call a `method(address) -> address` getter without reverting
+    @param _target address of the contract to call
+    @param _method_id method id of the getter
+    @param _arg address argument of the getter
+    @return success of the call, address returned by the getter
+    """
+    success: bool = False
+    response: Bytes[32] = b""
+    success, response = raw_call(
+        _target,
+        concat(_method_id, convert(_arg, bytes32)),
+        max_outsize=32,
+        revert_on_failure=False,
+        is_static_call=True
+    )
+    if not success or len(response) != 32:
+        return False, empty(address)
+    return True, _abi_decode(response, address)
+
+
 # ---- most used methods: Admin / DAO privileged methods ---- #
 @external
 def add_registry_handler(_registry_handler: address):
@@ -163,6 +229,24 @@ def update_gauge_data(_gauge_factory: address, _gauge_type: int128):
     self.gauge_type = _gauge_type
 
 
+# ---- permissionless methods ---- #
+@external
+def cache_gauges(_pools: DynArray[address, MAX_BATCH]):
+    """
+    @notice Cache the gauges of `_pools` so that gauge getters skip the gauge factory
+    @dev Permissionless: gauges are read from the current gauge factory, and
+         a factory never changes the gauge of an lp token once it is deployed.
+         Pools without a gauge are not cached
+    @param _pools List of pool addresses
+    """
+    gauge_factory: address = self.gauge_factory.address
+    for pool in _pools:
+        lp_token: address = RegistryHandler(self._get_registry_handlers_from_pool(pool)[0]).get_lp_token(pool)
+        gauge: address = GaugeFactory(gauge_factory).get_gauge_from_lp_token(lp_token)
+        if gauge != empty(address):
+            self.cached_gauge[gauge_factory][lp_token] = gauge
+
+
 # ---- view methods (API) of the contract ---- #
 
 
@@ -358,7 +442,7 @@ def get_gauge(_pool: address, gauge_idx: uint256 = 0, _handler_id: uint256 = 0)
     @return Address of gauge
     """
     lp_token: address = RegistryHandler(self._get_registry_handlers_from_pool(_pool)[_handler_id]).get_lp_token(_pool)
-    return self.gauge_factory.get_gauge_from_lp_token(lp_token)
+    return self._get_gauge(self.gauge_factory.address, lp_token)
 
 
 @external
@@ -374,6 +458,56 @@ def get_gauge_type(_pool: address, gauge_idx: uint256 = 0, _handler_id: uint256
     return self.gauge_type
 
 
+@external
+@view
+def get_gauges_many(
+    _pools: DynArray[address, MAX_BATCH]
+) -> (DynArray[bool, MAX_BATCH], DynArray[address, MAX_BATCH], DynArray[int128, MAX_BATCH]):
+    """
+    @notice Get the liquidity gauge and its gauge_type for a list of pools
+    @dev Uses the first registry handler of each pool. Pools that are not
+         registered, or whose lp token or gauge lookup reverts, are flagged
+         False and get an empty gauge
+    @param _pools List of pool addresses
+    @return List of success flags, list of gauges, list of gauge types
+    """
+    successes: DynArray[bool, MAX_BATCH] = []
+    gauges: DynArray[address, MAX_BATCH] = []
+    types: DynArray[int128, MAX_BATCH] = []
+
+    gauge_factory: address = self.gauge_factory.address
+    gauge_type: int128 = self.gauge_type
+    for pool in _pools:
+
+        success: bool = False
+        lp_token: address = empty(address)
+        gauge: address = empty(address)
+
+        handler: address = self._get_first_registry_handler(pool)
+        if handler != empty(address):
+            success, lp_token = self._try_address_call(
+                handler, method_id("get_lp_token(address)"), pool
+            )
+
+        if success:
+            gauge = self.cached_gauge[gauge_factory][lp_token]
+            if gauge == empty(address):
+                success, gauge = self._try_address_call(
+                    gauge_factory, method_id("get_gauge_from_lp_token(address)"), lp_token
+                )
+
+        if success:
+            successes.append(True)
+            gauges.append(gauge)
+            types.append(gauge_type)
+        else:
+            successes.append(False)
+            gauges.append(empty(address))
+            types.append(0)
+
+    return successes, gauges, types
+
+
 @external
 @view
 def get_lp_token(_pool: address, _handler_id: uint256 = 0) -> address:
@@ -433,6 +567,60 @@ def get_pool_from_lp_token(_token: address, _handler_id: uint256 = 0) -> address
     return self._get_pool_from_lp_token(_token)
 
 
+@external
+@view
+def get_pool_info(_pool: address, _handler_id: uint256 = 0) -> PoolInfo:
+    """
+    @notice Get the coins, balances, fees and metadata of a pool in one call
+    @dev Uses the handler's `get_pool_info` if it has one, and queries the
+         handler's individual getters otherwise. Reverts with the handler's
+         error if its `get_pool_info` reverts. The gauge is queried from the
+         gauge factory
+    @param _pool Pool address
+    @param _handler_id id of registry handler
+    @return PoolInfo struct of the pool
+    """
+    registry_handler: address = self._get_registry_handlers_from_pool(_pool)[_handler_id]
+
+    success: bool = False
+    response: Bytes[1632] = b""
+    success, response = raw_call(
+        registry_handler,
+        concat(
+            method_id("get_pool_info(address)"),
+            convert(_pool, bytes32),
+        ),
+        max_outsize=1632,
+        revert_on_failure=False,
+        is_static_call=True
+    )
+
+    # handlers without `get_pool_info` revert without data, or return nothing
+    # from a fallback function. anything else is an error of the handler:
+    if not success and len(response) > 0:
+        raw_revert(response)
+
+    pool_info: PoolInfo = empty(PoolInfo)
+    if success and len(response) > 0:
+        pool_info = _abi_decode(response, PoolInfo)
+    else:
+        pool_info = PoolInfo({
+            coins: RegistryHandler(registry_handler).get_coins(_pool),
+            decimals: RegistryHandler(registry_handler).get_decimals(_pool),
+            balances: RegistryHandler(registry_handler).get_balances(_pool),
+            underlying_coins: RegistryHandler(registry_handler).get_underlying_coins(_pool),
+            fees: RegistryHandler(registry_handler).get_fees(_pool),
+            lp_token: RegistryHandler(registry_handler).get_lp_token(_pool),
+            gauge: empty(address),
+            is_meta: RegistryHandler(registry_handler).is_meta(_pool),
+            asset_type: RegistryHandler(registry_handler).get_pool_asset_type(_pool),
+            name: RegistryHandler(registry_handler).get_pool_name(_pool),
+        })
+
+    pool_info.gauge = self._get_gauge(self.gauge_factory.address, pool_info.lp_token)
+    return pool_info
+
+
 @external
 @view
 def get_pool_params(_pool: address, _handler_id: uint256 = 0) -> uint256[MAX_POOL_PARAMS]:
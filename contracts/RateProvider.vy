@@ -2,18 +2,26 @@
 # pragma evm-version paris
 """
 @title CurveRateProvider
-@custom:version 1.0.0
+@custom:version 1.1.0
 @author Curve.Fi
 @license Copyright (c) Curve.Fi, 2020-2024 - all rights reserved
 @notice Provides quotes for coin pairs, iff coin pair is in a Curve AMM that the Metaregistry recognises.
 """
 
-version: public(constant(String[8])) = "1.0.0"
+version: public(constant(String[8])) = "1.1.0"
 
 from vyper.interfaces import ERC20Detailed
 
 MAX_COINS: constant(uint256) = 8
 MAX_QUOTES: constant(uint256) = 100
+MAX_BATCH_PAIRS: constant(uint256) = 10
+MAX_BATCH_AMOUNTS: constant(uint256) = 10
+MAX_HOPS: constant(uint256) = 2
+MAX_ROUTE_CANDIDATES: constant(uint256) = 20
+MAX_ROUTE_POOLS: constant(uint256) = 20
+MAX_BASE_POOLS: constant(uint256) = 100
+MAX_ROUTE_COINS: constant(uint256) = 200
+ROUTE_COINS_PER_CANDIDATE: constant(uint256) = 4
 
 struct Quote:
     source_token_index: uint256
@@ -25,6 +33,21 @@ struct Quote:
     dest_token_pool_balance: uint256
     pool_type: uint8  # 0 for stableswap, 1 for cryptoswap, 2 for LLAMMA.
 
+struct QuoteLadder:
+    source_token_index: uint256
+    dest_token_index: uint256
+    is_underlying: bool
+    amounts_out: DynArray[uint256, MAX_BATCH_AMOUNTS]  # 0 where get_dy failed.
+    pool: address
+    source_token_pool_balance: uint256
+    dest_token_pool_balance: uint256
+    pool_type: uint8
+
+struct Route:
+    coins: address[MAX_HOPS + 1]  # source, intermediate (empty for one hop), destination.
+    pools: address[MAX_HOPS]
+    amount_out: uint256
+
 
 # Interfaces
 
@@ -35,36 +58,380 @@ interface Metaregistry:
     def find_pools_for_coins(source_coin: address, destination_coin: address) -> DynArray[address, 1000]: view
     def get_coin_indices(_pool: address, _from: address, _to: address) -> (int128, int128, bool): view
     def get_underlying_balances(_pool: address) -> uint256[MAX_COINS]: view
+    def get_underlying_coins(_pool: address) -> address[MAX_COINS]: view
+    def get_pool_count_for_coins(_from: address, _to: address) -> uint256: view
+    def is_registered(_pool: address, _handler_id: uint256 = 0) -> bool: view
+
+interface BasePoolRegistry:
+    def base_pool_count() -> uint256: view
+    def base_pool_list(i: uint256) -> address: view
+    def get_coins(_pool: address) -> address[MAX_COINS]: view
+    def get_basepools_for_coin(_coin: address) -> DynArray[address, 1000]: view
 
 
 ADDRESS_PROVIDER: public(immutable(AddressProvider))
 METAREGISTRY_ID: constant(uint256) = 7
+BASE_POOL_REGISTRY_ID: constant(uint256) = 26
 STABLESWAP_META_ABI: constant(String[64]) = "get_dy_underlying(int128,int128,uint256)"
 STABLESWAP_ABI: constant(String[64]) = "get_dy(int128,int128,uint256)"
 CRYPTOSWAP_ABI: constant(String[64]) = "get_dy(uint256,uint256,uint256)"
 
+# where an oracle mode quote came from:
+RATE_SOURCE_GET_DY: constant(uint8) = 0
+RATE_SOURCE_PRICE_ORACLE: constant(uint8) = 1
+RATE_SOURCE_LAST_PRICES: constant(uint8) = 2
+
+# pool -> pool type + 1, so that 0 means the pool type is not cached:
+cached_pool_type: HashMap[address, uint8]
+
 @external
 def __init__(address_provider: address):
     ADDRESS_PROVIDER = AddressProvider(address_provider)
 
 
+@external
+def cache_pool_types(pools: DynArray[address, MAX_QUOTES]):
+    """
+    @notice Cache the pool types of `pools` so that quotes skip probing them
+    @dev Permissionless: pool types are probed on-chain and never change. Only
+         deployed pools listed in the MetaRegistry can be cached, so that the
+         type of an address cannot be cached before a pool is deployed there
+    """
+    metaregistry: Metaregistry = Metaregistry(ADDRESS_PROVIDER.get_address(METAREGISTRY_ID))
+    for pool in pools:
+        assert pool.is_contract  # dev: not a contract
+        assert metaregistry.is_registered(pool)  # dev: pool not registered
+        self.cached_pool_type[pool] = self._probe_pool_type(pool) + 1
+
+
+@external
+@view
+def get_pool_type(pool: address) -> uint8:
+    """
+    @notice Get the pool type used to quote `pool`
+    @return 0 for stableswap, 1 for cryptoswap, 2 for LLAMMA
+    """
+    return self._get_pool_type(pool)
+
+
 @external
 @view
 def get_quotes(source_token: address, destination_token: address, amount_in: uint256) -> DynArray[Quote, MAX_QUOTES]:
     return self._get_quotes(source_token, destination_token, amount_in)
 
 
+@external
+@view
+def get_quotes_for_pools(
+    source_token: address,
+    destination_token: address,
+    amount_in: uint256,
+    pools: DynArray[address, 1000]
+) -> DynArray[Quote, MAX_QUOTES]:
+    """
+    @notice Get quotes from a caller supplied set of pools
+    @dev Skips pool discovery: only coin indices, balances and get_dy are
+         queried. Pools that do not hold both coins should not be supplied.
+    @param source_token Address of the token to swap from
+    @param destination_token Address of the token to swap to
+    @param amount_in Amount of source_token to quote
+    @param pools Candidate pools to quote
+    @return Quotes in the same format as get_quotes
+    """
+    metaregistry: Metaregistry = Metaregistry(ADDRESS_PROVIDER.get_address(METAREGISTRY_ID))
+    return self._get_quotes_for_pools(source_token, destination_token, amount_in, pools, metaregistry)
+
+
+@external
+@view
+def get_quotes_filtered(
+    source_token: address,
+    destination_token: address,
+    amount_in: uint256,
+    min_liquidity: uint256,
+    max_pools: uint256
+) -> DynArray[Quote, MAX_QUOTES]:
+    """
+    @notice Get quotes from the deepest pools of a pair only
+    @dev Balances are read for every pool first; get_dy is then run on the
+         deepest pools with at least `min_liquidity` until `max_pools` of them
+         quote, so a pool whose get_dy fails is replaced by the next deepest
+         one. Liquidity is the sum of both coin balances normalized to 18
+         decimals, as used by get_aggregated_rate. Quotes are sorted by
+         descending liquidity.
+    @param source_token Address of the token to swap from
+    @param destination_token Address of the token to swap to
+    @param amount_in Amount of source_token to quote
+    @param min_liquidity Minimum normalized liquidity of a quoted pool
+    @param max_pools Maximum number of pools to quote
+    @return Quotes in the same format as get_quotes
+    """
+    assert max_pools > 0 and max_pools <= MAX_QUOTES  # dev: invalid max_pools
+
+    metaregistry: Metaregistry = Metaregistry(ADDRESS_PROVIDER.get_address(METAREGISTRY_ID))
+    pools: DynArray[address, 1000] = metaregistry.find_pools_for_coins(source_token, destination_token)
+    source_token_decimals: uint256 = convert(ERC20Detailed(source_token).decimals(), uint256)
+    dest_token_decimals: uint256 = convert(ERC20Detailed(destination_token).decimals(), uint256)
+
+    # keep the MAX_QUOTES deepest pools sorted by descending liquidity, so that
+    # pools failing get_dy can be replaced by shallower ones:
+    candidates: DynArray[Quote, MAX_QUOTES] = []
+    liquidities: DynArray[uint256, MAX_QUOTES] = []
+    for pool in pools:
+
+        i: int128 = 0
+        j: int128 = 0
+        is_underlying: bool = False
+        (i, j, is_underlying) = metaregistry.get_coin_indices(pool, source_token, destination_token)
+
+        balances: uint256[MAX_COINS] = metaregistry.get_underlying_balances(pool)
+        liquidity: uint256 = (
+            self._normalize_balance(balances[i], source_token_decimals) +
+            self._normalize_balance(balances[j], dest_token_decimals)
+        )
+        if liquidity < min_liquidity:
+            continue
+
+        n: uint256 = len(candidates)
+        if n == MAX_QUOTES:
+            if liquidity <= liquidities[n - 1]:
+                continue
+            candidates.pop()
+            liquidities.pop()
+            n -= 1
+
+        candidate: Quote = Quote(
+            {
+                source_token_index: convert(i, uint256),
+                dest_token_index: convert(j, uint256),
+                is_underlying: is_underlying,
+                amount_out: 0,
+                pool: pool,
+                source_token_pool_balance: balances[i],
+                dest_token_pool_balance: balances[j],
+                pool_type: 0
+            }
+        )
+        candidates.append(candidate)
+        liquidities.append(liquidity)
+
+        # shift shallower candidates down and insert the new one in place:
+        position: uint256 = n
+        for k in range(MAX_QUOTES):
+            if position == 0 or liquidities[position - 1] >= liquidity:
+                break
+            candidates[position] = candidates[position - 1]
+            liquidities[position] = liquidities[position - 1]
+            position -= 1
+
+        candidates[position] = candidate
+        liquidities[position] = liquidity
+
+    # only quote the deepest pools:
+    quotes: DynArray[Quote, MAX_QUOTES] = []
+    for candidate in candidates:
+        if len(quotes) == max_pools:
+            break
+        quote: Quote = candidate
+        quote.pool_type = self._get_pool_type(quote.pool)
+        quote.amount_out = self._get_pool_quote(
+            convert(quote.source_token_index, int128),
+            convert(quote.dest_token_index, int128),
+            amount_in,
+            quote.pool,
+            quote.pool_type,
+            quote.is_underlying
+        )
+        if quote.amount_out > 0:
+            quotes.append(quote)
+
+    return quotes
+
+
+@external
+@view
+def get_quotes_batch(
+    pairs: DynArray[address[2], MAX_BATCH_PAIRS],
+    amounts_in: DynArray[DynArray[uint256, MAX_BATCH_AMOUNTS], MAX_BATCH_PAIRS]
+) -> DynArray[DynArray[QuoteLadder, MAX_QUOTES], MAX_BATCH_PAIRS]:
+    """
+    @notice Quote several amounts for several (source, destination) pairs
+    @dev Pools, coin indices and balances are fetched once per pair and
+         shared by all of the pair's amounts
+    @param pairs (source token, destination token) pairs
+    @param amounts_in Amounts to quote for each pair
+    @return A quote ladder per pool for each pair
+    """
+    assert len(pairs) == len(amounts_in)  # dev: pairs and amounts mismatch
+
+    metaregistry: Metaregistry = Metaregistry(ADDRESS_PROVIDER.get_address(METAREGISTRY_ID))
+    ladders: DynArray[DynArray[QuoteLadder, MAX_QUOTES], MAX_BATCH_PAIRS] = []
+    for k in range(len(pairs), bound=MAX_BATCH_PAIRS):
+        ladders.append(
+            self._get_quote_ladders(pairs[k][0], pairs[k][1], amounts_in[k], metaregistry)
+        )
+
+    return ladders
+
+
+@external
+@view
+def get_best_route(
+    source_token: address,
+    destination_token: address,
+    amount_in: uint256,
+    max_hops: uint256,
+    max_candidates: uint256
+) -> Route:
+    """
+    @notice Get the best route between two coins, through at most one intermediate coin
+    @dev Intermediate coins are the coins the MetaRegistry lists for the pools
+         of the pair, then the coins of base pools in the BasePoolRegistry
+         of the AddressProvider, starting with the base pools holding either
+         coin. Only MetaRegistry coins are used if the AddressProvider has no
+         BasePoolRegistry. At most `max_candidates * ROUTE_COINS_PER_CANDIDATE`
+         coins are checked for pools on both hops, each with two
+         `get_pool_count_for_coins` calls; coins without pools on either hop
+         are skipped without being quoted. Each hop is quoted with get_dy on
+         every pool the MetaRegistry lists for it, and the best pool is used
+         to quote the next hop.
+    @param source_token Address of the token to swap from
+    @param destination_token Address of the token to swap to
+    @param amount_in Amount of source_token to route
+    @param max_hops Maximum number of hops, 1 or 2
+    @param max_candidates Maximum number of intermediate coins to try
+    @return The route with the highest amount out; amount_out is 0 if there is none
+    """
+    assert max_hops > 0 and max_hops <= MAX_HOPS  # dev: invalid max_hops
+    assert max_candidates <= MAX_ROUTE_CANDIDATES  # dev: too many candidates
+
+    metaregistry: Metaregistry = Metaregistry(ADDRESS_PROVIDER.get_address(METAREGISTRY_ID))
+    direct_pools: DynArray[address, 1000] = metaregistry.find_pools_for_coins(source_token, destination_token)
+
+    pool: address = empty(address)
+    amount_out: uint256 = 0
+    pool, amount_out = self._get_best_quote(source_token, destination_token, amount_in, direct_pools, metaregistry)
+
+    best_route: Route = empty(Route)
+    best_route.coins[0] = source_token
+    best_route.coins[MAX_HOPS] = destination_token
+    best_route.pools[0] = pool
+    best_route.amount_out = amount_out
+
+    if max_hops == 1:
+        return best_route
+
+    candidates: DynArray[address, MAX_ROUTE_CANDIDATES] = self._get_route_candidates(
+        source_token,
+        destination_token,
+        direct_pools,
+        BasePoolRegistry(ADDRESS_PROVIDER.get_address(BASE_POOL_REGISTRY_ID)),
+        max_candidates,
+        metaregistry
+    )
+    for candidate in candidates:
+
+        first_pool: address = empty(address)
+        intermediate_amount: uint256 = 0
+        first_pool, intermediate_amount = self._get_best_quote(
+            source_token,
+            candidate,
+            amount_in,
+            metaregistry.find_pools_for_coins(source_token, candidate),
+            metaregistry
+        )
+        if intermediate_amount == 0:
+            continue
+
+        second_pool: address = empty(address)
+        second_pool, amount_out = self._get_best_quote(
+            candidate,
+            destination_token,
+            intermediate_amount,
+            metaregistry.find_pools_for_coins(candidate, destination_token),
+            metaregistry
+        )
+        if amount_out > best_route.amount_out:
+            best_route.coins[1] = candidate
+            best_route.pools = [first_pool, second_pool]
+            best_route.amount_out = amount_out
+
+    return best_route
+
+
 @external
 @view
 def get_aggregated_rate(source_token: address, destination_token: address) -> uint256:
 
-    amount_in: uint256 = 10**convert(ERC20Detailed(source_token).decimals(), uint256)
-    quotes: DynArray[Quote, MAX_QUOTES] = self._get_quotes(source_token, destination_token, amount_in)
+    source_token_decimals: uint256 = convert(ERC20Detailed(source_token).decimals(), uint256)
+    dest_token_decimals: uint256 = convert(ERC20Detailed(destination_token).decimals(), uint256)
+    quotes: DynArray[Quote, MAX_QUOTES] = self._get_quotes(
+        source_token, destination_token, 10**source_token_decimals
+    )
+
+    return self.weighted_average_quote(source_token_decimals, dest_token_decimals, quotes)
 
-    return self.weighted_average_quote(
-        convert(ERC20Detailed(source_token).decimals(), uint256),
-        convert(ERC20Detailed(destination_token).decimals(), uint256),
+
+@external
+@view
+def get_aggregated_rate_with_decimals(
+    source_token: address,
+    destination_token: address,
+    source_token_decimals: uint256,
+    dest_token_decimals: uint256
+) -> uint256:
+    """
+    @notice Get the liquidity weighted rate of a pair with known token decimals
+    @dev Skips the decimals() calls of get_aggregated_rate, e.g. for callers
+         that already read decimals from MetaRegistry.get_decimals
+    @param source_token Address of the token to swap from
+    @param destination_token Address of the token to swap to
+    @param source_token_decimals Decimals of source_token
+    @param dest_token_decimals Decimals of destination_token
+    @return The aggregated rate
+    """
+    quotes: DynArray[Quote, MAX_QUOTES] = self._get_quotes(
+        source_token, destination_token, 10**source_token_decimals
+    )
+
+    return self.weighted_average_quote(source_token_decimals, dest_token_decimals, quotes)
+
+
+@external
+@view
+def get_aggregated_rate_from_oracles(
+    source_token: address,
+    destination_token: address,
+    use_last_prices: bool = False
+) -> (uint256, DynArray[Quote, MAX_QUOTES], DynArray[uint8, MAX_QUOTES]):
+    """
+    @notice Get the liquidity weighted rate of a pair, reading pool oracles where possible
+    @dev Pools exposing `price_oracle` (or `last_prices`) are not simulated with get_dy.
+         Underlying (metapool) pairs and pools without oracles fall back to get_dy.
+         Quotes are weighted exactly like get_aggregated_rate.
+    @param source_token Address of the token to swap from
+    @param destination_token Address of the token to swap to
+    @param use_last_prices Read `last_prices` instead of the `price_oracle` EMA
+    @return The aggregated rate, the quotes it was computed from and the
+            source of each quote: 0 for get_dy, 1 for price_oracle, 2 for last_prices
+    """
+    source_token_decimals: uint256 = convert(ERC20Detailed(source_token).decimals(), uint256)
+    dest_token_decimals: uint256 = convert(ERC20Detailed(destination_token).decimals(), uint256)
+
+    quotes: DynArray[Quote, MAX_QUOTES] = []
+    rate_sources: DynArray[uint8, MAX_QUOTES] = []
+    quotes, rate_sources = self._get_oracle_quotes(
+        source_token,
+        destination_token,
+        10**source_token_decimals,
+        10**dest_token_decimals,
+        use_last_prices
+    )
+
+    return (
+        self.weighted_average_quote(source_token_decimals, dest_token_decimals, quotes),
         quotes,
+        rate_sources
     )
 
 
@@ -76,36 +443,43 @@ def weighted_average_quote(
     quotes: DynArray[Quote, MAX_QUOTES]
 ) -> uint256:
 
-    num_quotes: uint256 = len(quotes)
-
-    # Calculate total balance with normalization
+    # normalized pool balances weigh the quotes, aggregated in a single pass:
     total_balance: uint256 = 0
-    for i in range(num_quotes, bound=MAX_QUOTES):
-        source_balance_normalized: uint256 = quotes[i].source_token_pool_balance * 10**(18 - source_token_decimals)
-        dest_balance_normalized: uint256 = quotes[i].dest_token_pool_balance * 10**(18 - dest_token_decimals)
-        total_balance += source_balance_normalized + dest_balance_normalized
-
+    weighted_sum: uint256 = 0
+    for quote in quotes:
+        pool_balance_normalized: uint256 = (
+            self._normalize_balance(quote.source_token_pool_balance, source_token_decimals) +
+            self._normalize_balance(quote.dest_token_pool_balance, dest_token_decimals)
+        )
+        total_balance += pool_balance_normalized
+        weighted_sum += pool_balance_normalized * quote.amount_out
 
-    # Calculate weighted sum with normalization
-    weighted_avg: uint256 = 0
-    for i in range(num_quotes, bound=MAX_QUOTES):
-        source_balance_normalized: uint256 = quotes[i].source_token_pool_balance * 10**(18 - source_token_decimals)
-        dest_balance_normalized: uint256 = quotes[i].dest_token_pool_balance * 10**(18 - dest_token_decimals)
-        pool_balance_normalized: uint256 = source_balance_normalized + dest_balance_normalized
-        weight: uint256 = (pool_balance_normalized * 10**18) / total_balance  # Use 18 decimal places for precision
-        weighted_avg += weight * quotes[i].amount_out / 10**18
+    if total_balance == 0:
+        return 0
 
-    return weighted_avg
+    return weighted_sum / total_balance
 
 
 @internal
 @view
 def _get_quotes(source_token: address, destination_token: address, amount_in: uint256) -> DynArray[Quote, MAX_QUOTES]:
 
-    quotes: DynArray[Quote, MAX_QUOTES] = []
     metaregistry: Metaregistry = Metaregistry(ADDRESS_PROVIDER.get_address(METAREGISTRY_ID))
     pools: DynArray[address, 1000] = metaregistry.find_pools_for_coins(source_token, destination_token)
+    return self._get_quotes_for_pools(source_token, destination_token, amount_in, pools, metaregistry)
 
+
+@internal
+@view
+def _get_quotes_for_pools(
+    source_token: address,
+    destination_token: address,
+    amount_in: uint256,
+    pools: DynArray[address, 1000],
+    metaregistry: Metaregistry
+) -> DynArray[Quote, MAX_QUOTES]:
+
+    quotes: DynArray[Quote, MAX_QUOTES] = []
     if len(pools) == 0:
         return quotes
 
@@ -113,7 +487,7 @@ def _get_quotes(source_token: address, destination_token: address, amount_in: ui
     for pool in pools:
 
         # is it a stableswap pool? are the coin pairs part of a metapool?
-        pool_type: uint8 = self._get_pool_type(pool, metaregistry)
+        pool_type: uint8 = self._get_pool_type(pool)
 
         # get coin indices
         i: int128 = 0
@@ -157,9 +531,248 @@ def _get_quotes(source_token: address, destination_token: address, amount_in: ui
 
 @internal
 @view
-def _get_pool_type(pool: address, metaregistry: Metaregistry) -> uint8:
+def _get_oracle_quotes(
+    source_token: address,
+    destination_token: address,
+    amount_in: uint256,
+    dest_token_unit: uint256,
+    use_last_prices: bool
+) -> (DynArray[Quote, MAX_QUOTES], DynArray[uint8, MAX_QUOTES]):
+
+    quotes: DynArray[Quote, MAX_QUOTES] = []
+    rate_sources: DynArray[uint8, MAX_QUOTES] = []
+    metaregistry: Metaregistry = Metaregistry(ADDRESS_PROVIDER.get_address(METAREGISTRY_ID))
+    pools: DynArray[address, 1000] = metaregistry.find_pools_for_coins(source_token, destination_token)
+
+    oracle_source: uint8 = RATE_SOURCE_PRICE_ORACLE
+    if use_last_prices:
+        oracle_source = RATE_SOURCE_LAST_PRICES
+
+    for pool in pools:
+
+        if len(quotes) == MAX_QUOTES:
+            break
+
+        pool_type: uint8 = self._get_pool_type(pool)
+
+        i: int128 = 0
+        j: int128 = 0
+        is_underlying: bool = False
+        (i, j, is_underlying) = metaregistry.get_coin_indices(pool, source_token, destination_token)
+
+        # oracles price the pool's own coins, so underlying pairs are simulated:
+        quote: uint256 = 0
+        rate_source: uint8 = RATE_SOURCE_GET_DY
+        if not is_underlying:
+            quote = self._get_oracle_quote(
+                convert(i, uint256), convert(j, uint256), dest_token_unit, pool, use_last_prices
+            )
+            rate_source = oracle_source
+
+        if quote == 0:
+            quote = self._get_pool_quote(i, j, amount_in, pool, pool_type, is_underlying)
+            rate_source = RATE_SOURCE_GET_DY
+
+        if quote == 0:
+            continue
+
+        balances: uint256[MAX_COINS] = metaregistry.get_underlying_balances(pool)
+        quotes.append(
+            Quote(
+                {
+                    source_token_index: convert(i, uint256),
+                    dest_token_index: convert(j, uint256),
+                    is_underlying: is_underlying,
+                    amount_out: quote,
+                    pool: pool,
+                    source_token_pool_balance: balances[i],
+                    dest_token_pool_balance: balances[j],
+                    pool_type: pool_type
+                }
+            )
+        )
+        rate_sources.append(rate_source)
+
+    return quotes, rate_sources
+
+
+@internal
+@view
+def _get_best_quote(
+    source_token: address,
+    destination_token: address,
+    amount_in: uint256,
+    pools: DynArray[address, 1000],
+    metaregistry: Metaregistry
+) -> (address, uint256):
+
+    # only get_dy is needed to rank pools, so balances are not fetched:
+    best_pool: address = empty(address)
+    best_amount_out: uint256 = 0
+    for pool in pools:
+
+        i: int128 = 0
+        j: int128 = 0
+        is_underlying: bool = False
+        (i, j, is_underlying) = metaregistry.get_coin_indices(pool, source_token, destination_token)
+
+        amount_out: uint256 = self._get_pool_quote(
+            i, j, amount_in, pool, self._get_pool_type(pool), is_underlying
+        )
+        if amount_out > best_amount_out:
+            best_pool = pool
+            best_amount_out = amount_out
+
+    return best_pool, best_amount_out
+
+
+@internal
+@view
+def _get_route_candidates(
+    source_token: address,
+    destination_token: address,
+    direct_pools: DynArray[address, 1000],
+    base_pool_registry: BasePoolRegistry,
+    max_candidates: uint256,
+    metaregistry: Metaregistry
+) -> DynArray[address, MAX_ROUTE_CANDIDATES]:
+
+    # coins the MetaRegistry lists for the pools of the pair come first:
+    coins: DynArray[address, MAX_ROUTE_COINS] = []
+    for k in range(MAX_ROUTE_POOLS):
+        if k == len(direct_pools):
+            break
+        pool_coins: address[MAX_COINS] = metaregistry.get_underlying_coins(direct_pools[k])
+        for coin in pool_coins:
+            if coin == empty(address):
+                break
+            if coin not in coins:
+                coins.append(coin)
+
+    # then the coins of base pools holding either coin, then of all other base pools:
+    if base_pool_registry.address != empty(address):
+
+        base_pools: DynArray[address, MAX_BASE_POOLS] = []
+        for coin in [source_token, destination_token]:
+            coin_base_pools: DynArray[address, 1000] = base_pool_registry.get_basepools_for_coin(coin)
+            for base_pool in coin_base_pools:
+                if len(base_pools) == MAX_BASE_POOLS:
+                    break
+                if base_pool not in base_pools:
+                    base_pools.append(base_pool)
+
+        base_pool_count: uint256 = base_pool_registry.base_pool_count()
+        for i in range(MAX_BASE_POOLS):
+            if i == base_pool_count or len(base_pools) == MAX_BASE_POOLS:
+                break
+            base_pool: address = base_pool_registry.base_pool_list(i)
+            if base_pool not in base_pools:
+                base_pools.append(base_pool)
+
+        for base_pool in base_pools:
+            pool_coins: address[MAX_COINS] = base_pool_registry.get_coins(base_pool)
+            for coin in pool_coins:
+                if coin == empty(address) or len(coins) == MAX_ROUTE_COINS:
+                    break
+                if coin not in coins:
+                    coins.append(coin)
+
+    # only keep coins the MetaRegistry lists pools for on both hops, checking
+    # a bounded number of coins since every check scans the registry handlers:
+    candidates: DynArray[address, MAX_ROUTE_CANDIDATES] = []
+    checked_coins: uint256 = 0
+    for coin in coins:
+        if len(candidates) == max_candidates or checked_coins == max_candidates * ROUTE_COINS_PER_CANDIDATE:
+            break
+        if coin == source_token or coin == destination_token:
+            continue
+        checked_coins += 1
+        if metaregistry.get_pool_count_for_coins(source_token, coin) == 0:
+            continue
+        if metaregistry.get_pool_count_for_coins(coin, destination_token) == 0:
+            continue
+        candidates.append(coin)
+
+    return candidates
+
+
+@internal
+@view
+def _get_quote_ladders(
+    source_token: address,
+    destination_token: address,
+    amounts_in: DynArray[uint256, MAX_BATCH_AMOUNTS],
+    metaregistry: Metaregistry
+) -> DynArray[QuoteLadder, MAX_QUOTES]:
+
+    ladders: DynArray[QuoteLadder, MAX_QUOTES] = []
+    pools: DynArray[address, 1000] = metaregistry.find_pools_for_coins(source_token, destination_token)
+
+    for pool in pools:
+
+        if len(ladders) == MAX_QUOTES:
+            break
+
+        pool_type: uint8 = self._get_pool_type(pool)
+
+        i: int128 = 0
+        j: int128 = 0
+        is_underlying: bool = False
+        (i, j, is_underlying) = metaregistry.get_coin_indices(pool, source_token, destination_token)
+
+        # quote every amount, and only keep pools that quote at least one of them:
+        amounts_out: DynArray[uint256, MAX_BATCH_AMOUNTS] = []
+        has_quote: bool = False
+        for amount_in in amounts_in:
+            quote: uint256 = self._get_pool_quote(i, j, amount_in, pool, pool_type, is_underlying)
+            amounts_out.append(quote)
+            has_quote = has_quote or quote > 0
+
+        if not has_quote:
+            continue
+
+        balances: uint256[MAX_COINS] = metaregistry.get_underlying_balances(pool)
+        ladders.append(
+            QuoteLadder(
+                {
+                    source_token_index: convert(i, uint256),
+                    dest_token_index: convert(j, uint256),
+                    is_underlying: is_underlying,
+                    amounts_out: amounts_out,
+                    pool: pool,
+                    source_token_pool_balance: balances[i],
+                    dest_token_pool_balance: balances[j],
+                    pool_type: pool_type
+                }
+            )
+        )
+
+    return ladders
+
+
+@internal
+@pure
+def _normalize_balance(balance: uint256, decimals: uint256) -> uint256:
+    if decimals > 18:
+        return balance / 10**(decimals - 18)
+    return balance * 10**(18 - decimals)
+
+
+@internal
+@view
+def _get_pool_type(pool: address) -> uint8:
 
     # 0 for stableswap, 1 for cryptoswap, 2 for LLAMMA.
+    cached_pool_type: uint8 = self.cached_pool_type[pool]
+    if cached_pool_type > 0:
+        return cached_pool_type - 1
+
+    return self._probe_pool_type(pool)
+
+
+@internal
+@view
+def _probe_pool_type(pool: address) -> uint8:
 
     success: bool = False
     response: Bytes[32] = b""
@@ -229,3 +842,77 @@ def _get_pool_quote(
         return convert(response, uint256)
 
     return 0
+
+
+@internal
+@view
+def _get_oracle_quote(
+    i: uint256,
+    j: uint256,
+    dest_token_unit: uint256,
+    pool: address,
+    use_last_prices: bool
+) -> uint256:
+
+    # oracle prices are coin prices in units of coin 0, with 18 decimals:
+    price_i: uint256 = self._get_oracle_price(pool, i, use_last_prices)
+    price_j: uint256 = self._get_oracle_price(pool, j, use_last_prices)
+    if price_i == 0 or price_j == 0:
+        return 0
+
+    # amount of destination coin for one unit of source coin:
+    return dest_token_unit * price_i / price_j
+
+
+@internal
+@view
+def _get_oracle_price(pool: address, k: uint256, use_last_prices: bool) -> uint256:
+
+    if k == 0:
+        return 10**18
+
+    success: bool = False
+    response: Bytes[32] = b""
+
+    # pools with more than two coins take the index of the coin (minus coin 0):
+    if use_last_prices:
+        success, response = raw_call(
+            pool,
+            concat(method_id("last_prices(uint256)"), convert(k - 1, bytes32)),
+            max_outsize=32,
+            revert_on_failure=False,
+            is_static_call=True
+        )
+    else:
+        success, response = raw_call(
+            pool,
+            concat(method_id("price_oracle(uint256)"), convert(k - 1, bytes32)),
+            max_outsize=32,
+            revert_on_failure=False,
+            is_static_call=True
+        )
+
+    # two coin pools take no argument. fallbacks and contracts without code
+    # succeed without returning a price:
+    if (not success or len(response) != 32) and k == 1:
+        if use_last_prices:
+            success, response = raw_call(
+                pool,
+                method_id("last_prices()"),
+                max_outsize=32,
+                revert_on_failure=False,
+                is_static_call=True
+            )
+        else:
+            success, response = raw_call(
+                pool,
+                method_id("price_oracle()"),
+                max_outsize=32,
+                revert_on_failure=False,
+                is_static_call=True
+            )
+
+    if success and len(response) == 32:
+        return convert(response, uint256)
+
+    return 0
@@ -0,0 +1,12 @@
+# pragma version 0.3.10
+
+"""
+@notice Mock base pool for testing
+"""
+
+coins: public(address[8])
+
+
+@external
+def __init__(_coins: address[8]):
+    self.coins = _coins
@@ -0,0 +1,54 @@
+# pragma version 0.3.10
+
+"""
+@notice Mock v2 crypto factory for testing
+"""
+
+pool_list: public(address[65536])
+pool_count: public(uint256)
+
+pool_coins: HashMap[address, address[2]]
+pool_token: HashMap[address, address]
+markets: HashMap[uint256, DynArray[address, 1000]]
+
+
+@internal
+@pure
+def _get_market_key(_coin_a: address, _coin_b: address) -> uint256:
+    return convert(_coin_a, uint256) ^ convert(_coin_b, uint256)
+
+
+@external
+def add_pool(_pool: address, _token: address, _coins: address[2]):
+    self.pool_list[self.pool_count] = _pool
+    self.pool_count += 1
+    self.pool_coins[_pool] = _coins
+    self.pool_token[_pool] = _token
+    self.markets[self._get_market_key(_coins[0], _coins[1])].append(_pool)
+
+
+@view
+@external
+def find_pool_for_coins(_from: address, _to: address, i: uint256 = 0) -> address:
+    key: uint256 = self._get_market_key(_from, _to)
+    if i < len(self.markets[key]):
+        return self.markets[key][i]
+    return empty(address)
+
+
+@view
+@external
+def get_coins(_pool: address) -> address[2]:
+    return self.pool_coins[_pool]
+
+
+@view
+@external
+def get_token(_pool: address) -> address:
+    return self.pool_token[_pool]
+
+
+@view
+@external
+def get_gauge(_pool: address) -> address:
+    return empty(address)
@@ -6,6 +6,7 @@
 @author Curve.Fi
 """
 MAX_COINS: constant(uint256) = 8
+MAX_BASE_POOLS_FOR_COIN: constant(uint256) = 1000
 
 
 struct BasePool:
@@ -15,6 +16,7 @@ struct BasePool:
     is_v2: bool
     is_legacy: bool
     is_lending: bool
+    coins: address[MAX_COINS]
 
 
 interface AddressProvider:
@@ -50,6 +52,9 @@ get_base_pool_for_lp_token: public(HashMap[address, address])
 base_pool_count: public(uint256)
 last_updated: public(uint256)
 
+# coin -> base pools holding the coin:
+base_pools_for_coin: HashMap[address, DynArray[address, MAX_BASE_POOLS_FOR_COIN]]
+
 
 @external
 def __init__():
@@ -58,9 +63,7 @@ def __init__():
 
 @internal
 @view
-def _get_basepool_coins(_pool: address) -> address[MAX_COINS]:
-    _n_coins: uint256 = self.base_pool[_pool].n_coins
-    _is_legacy: bool = self.base_pool[_pool].is_legacy
+def _fetch_basepool_coins(_pool: address, _n_coins: uint256, _is_legacy: bool) -> address[MAX_COINS]:
     _coins: address[MAX_COINS] = empty(address[MAX_COINS])
     for i in range(MAX_COINS):
         if i == _n_coins:
@@ -74,24 +77,25 @@ def _get_basepool_coins(_pool: address) -> address[MAX_COINS]:
     return _coins
 
 
-
 @internal
 @view
-def _get_basepools_for_coin(_coin: address) -> DynArray[address, 1000]:
-    """
-    @notice Gets the base pool for a coin
-    @dev Some coins can be in multiple base pools, this function returns
-         the base pool for a coin at a specific index
-    @param _coin Address of the coin
-    @return basepool addresses
-    """
-    _base_pools: DynArray[address, 1000] = empty(DynArray[address, 1000])
-    for _pool in self.base_pool_list:
-        _coins: address[MAX_COINS] = self._get_basepool_coins(_pool)
-        if _coin in _coins:
-            _base_pools.append(_pool)
+def _get_basepool_coins(_pool: address) -> address[MAX_COINS]:
+    return self.base_pool[_pool].coins
 
-    return _base_pools
+
+@internal
+def _remove_basepool_for_coin(_coin: address, _pool: address):
+    n_base_pools: uint256 = len(self.base_pools_for_coin[_coin])
+    for i in range(MAX_BASE_POOLS_FOR_COIN):
+        if i == n_base_pools:
+            break
+
+        if self.base_pools_for_coin[_coin][i] == _pool:
+            # replace _pool with the last base pool for the coin:
+            last_base_pool: address = self.base_pools_for_coin[_coin].pop()
+            if i < n_base_pools - 1:
+                self.base_pools_for_coin[_coin][i] = last_base_pool
+            return
 
 
 @external
@@ -116,7 +120,7 @@ def get_basepool_for_coin(_coin: address, _idx: uint256 = 0) -> address:
     @param _idx Index of base pool that holds the coin
     @return basepool address
     """
-    return self._get_basepools_for_coin(_coin)[_idx]
+    return self.base_pools_for_coin[_coin][_idx]
 
 
 @external
@@ -129,7 +133,7 @@ def get_basepools_for_coin(_coin: address) -> DynArray[address, 1000]:
     @param _coin Address of the coin
     @return basepool addresses
     """
-    return self._get_basepools_for_coin(_coin)
+    return self.base_pools_for_coin[_coin]
 
 
 @external
@@ -255,6 +259,14 @@ def add_base_pool(
     # for reverse lookup:
     self.get_base_pool_for_lp_token[_lp_token] = _pool
 
+    # store coins so that coin lookups do not need to query the pool:
+    _coins: address[MAX_COINS] = self._fetch_basepool_coins(_pool, _n_coins, _is_legacy)
+    self.base_pool[_pool].coins = _coins
+    for i in range(MAX_COINS):
+        if i == _n_coins:
+            break
+        self.base_pools_for_coin[_coins[i]].append(_pool)
+
     self.last_updated = block.timestamp
     self.base_pool_list[base_pool_count] = _pool
     self.base_pool_count = base_pool_count + 1
@@ -276,6 +288,14 @@ def remove_base_pool(_pool: address):
     self.base_pool[_pool].lp_token = empty(address)
     self.base_pool[_pool].n_coins = 0
 
+    # reset coin -> base pool mappings
+    _coins: address[MAX_COINS] = self.base_pool[_pool].coins
+    for i in range(MAX_COINS):
+        if _coins[i] == empty(address):
+            break
+        self._remove_basepool_for_coin(_coins[i], _pool)
+    self.base_pool[_pool].coins = empty(address[MAX_COINS])
+
     # remove base_pool from base_pool_list
     location: uint256 = self.base_pool[_pool].location
     length: uint256 = self.base_pool_count - 1
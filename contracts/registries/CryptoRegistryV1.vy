@@ -8,6 +8,7 @@
 
 MAX_COINS: constant(int128) = 8
 CALC_INPUT_SIZE: constant(int128) = 100
+MAX_BATCH: constant(uint256) = 20
 
 
 struct CoinInfo:
@@ -25,6 +26,17 @@ struct PoolArray:
     has_positive_rebasing_tokens: bool
 
 
+struct PoolParams:
+    pool: address
+    lp_token: address
+    gauge: address
+    zap: address
+    n_coins: uint256
+    name: String[64]
+    base_pool: address
+    has_positive_rebasing_tokens: bool
+
+
 interface AddressProvider:
     def admin() -> address: view
     def get_address(_id: uint256) -> address: view
@@ -105,6 +117,8 @@ get_lp_token: public(HashMap[address, address])
 # `bitwise_xor(convert(a, uint256), convert(b, uint256))`
 markets: HashMap[uint256, address[65536]]
 market_counts: HashMap[uint256, uint256]
+# market key -> pool -> index of the pool in `markets[key]`
+market_positions: HashMap[uint256, HashMap[address, uint256]]
 
 liquidity_gauges: HashMap[address, address[10]]
 
@@ -239,48 +253,55 @@ def _get_coin_indices(
     # from index, to index, is the market underlying?
     result: uint256[3] = empty(uint256[3])
     _coins: address[MAX_COINS] = self._get_coins(_pool)
-    found_market: bool = False
+    found_from: bool = False
+    found_to: bool = False
 
     # check coin markets
     for x in range(MAX_COINS):
         coin: address = _coins[x]
         if coin == empty(address):
-            # if we reach the end of the coins, reset `found_market` and try again
-            # with the underlying coins
-            found_market = False
             break
         if coin == _from:
             result[0] = convert(x, uint256)
+            found_from = True
         elif coin == _to:
             result[1] = convert(x, uint256)
+            found_to = True
         else:
             continue
 
-        if found_market:
-            # the second time we find a match, break out of the loop
+        if found_from and found_to:
+            return result
+
+    base_pool: address = self.pool_data[_pool].base_pool
+    if base_pool == empty(address):
+        return result
+
+    # underlying coins are the coins before the base pool lp token followed by
+    # the base pool coins: matches before the lp token are kept, and only the
+    # base pool coins are left to check.
+    base_coin_offset: uint256 = self.pool_data[_pool].n_coins - 1
+    found_from = found_from and result[0] < base_coin_offset
+    found_to = found_to and result[1] < base_coin_offset
+
+    base_pool_coins: address[MAX_COINS] = self.base_pool_registry.get_coins(base_pool)
+    for x in range(MAX_COINS):
+        if (found_from and found_to) or convert(x, uint256) + base_coin_offset == convert(MAX_COINS, uint256):
             break
-        # the first time we find a match, set `found_market` to True
-        found_market = True
-
-    if not found_market and self._is_meta(_pool):
-        # check underlying coin markets
-        underlying_coins: address[MAX_COINS] = self._get_underlying_coins_for_metapool(_pool)
-        for x in range(MAX_COINS):
-            coin: address = underlying_coins[x]
-            if coin == empty(address):
-                raise "No available market"
-            if coin == _from:
-                result[0] = convert(x, uint256)
-            elif coin == _to:
-                result[1] = convert(x, uint256)
-            else:
-                continue
+        coin: address = base_pool_coins[x]
+        if coin == empty(address):
+            break
+        if coin == _from and not found_from:
+            result[0] = convert(x, uint256) + base_coin_offset
+            found_from = True
+        elif coin == _to and not found_to:
+            result[1] = convert(x, uint256) + base_coin_offset
+            found_to = True
 
-            if found_market:
-                result[2] = 1
-                break
-            found_market = True
+    if not (found_from and found_to):
+        raise "No available market"
 
+    result[2] = 1
     return result
 
 
@@ -616,13 +637,16 @@ def get_pool_name(_pool: address) -> String[64]:
 # internal functionality used in admin setters
 
 @internal
-def _register_coin(_coin: address):
-    if self.coins[_coin].register_count == 0:
-        coin_count: uint256 = self.coin_count
+def _register_coin(_coin: address, _coin_count: uint256) -> uint256:
+    # `_coin_count` is the number of unique coins, written back by the caller:
+    coin_count: uint256 = _coin_count
+    register_count: uint256 = self.coins[_coin].register_count
+    if register_count == 0:
         self.coins[_coin].index = coin_count
         self.get_coin[coin_count] = _coin
-        self.coin_count += 1
-    self.coins[_coin].register_count += 1
+        coin_count += 1
+    self.coins[_coin].register_count = register_count + 1
+    return coin_count
 
 
 @internal
@@ -643,7 +667,11 @@ def _register_coin_pair(_coina: address, _coinb: address, _key: uint256):
 
 
 @internal
-def _add_coins_to_market(_pool: address, _coin_list: address[MAX_COINS], _is_underlying: bool = False):
+def _add_coins_to_market(
+    _pool: address, _coin_list: address[MAX_COINS], _coin_count: uint256, _is_underlying: bool = False
+) -> uint256:
+
+    coin_count: uint256 = _coin_count
 
     for i in range(MAX_COINS):
 
@@ -659,7 +687,7 @@ def _add_coins_to_market(_pool: address, _coin_list: address[MAX_COINS], _is_und
             break
 
         # register coin:
-        self._register_coin(_coin_list[i])
+        coin_count = self._register_coin(_coin_list[i], coin_count)
 
         # add pool to markets
         i2: int128 = i + 1
@@ -673,12 +701,15 @@ def _add_coins_to_market(_pool: address, _coin_list: address[MAX_COINS], _is_und
             )
             length: uint256 = self.market_counts[key]
             self.markets[key][length] = _pool
+            self.market_positions[key][_pool] = length
             self.market_counts[key] = length + 1
 
             # register the coin pair
             if length == 0:
                 self._register_coin_pair(_coin_list[x], _coin_list[i], key)
 
+    return coin_count
+
 
 @internal
 @view
@@ -690,12 +721,14 @@ def _market_exists(_pool: address, _coina: address, _coinb: address) -> bool:
 
 
 @internal
-def _unregister_coin(_coin: address):
-    self.coins[_coin].register_count -= 1
-
-    if self.coins[_coin].register_count == 0:
-        self.coin_count -= 1
-        coin_count: uint256 = self.coin_count
+def _unregister_coin(_coin: address, _coin_count: uint256) -> uint256:
+    # `_coin_count` is the number of unique coins, written back by the caller:
+    coin_count: uint256 = _coin_count
+    register_count: uint256 = self.coins[_coin].register_count - 1
+    self.coins[_coin].register_count = register_count
+
+    if register_count == 0:
+        coin_count -= 1
         location: uint256 = self.coins[_coin].index
 
         if location < coin_count:
@@ -706,6 +739,8 @@ def _unregister_coin(_coin: address):
         self.coins[_coin].index = 0
         self.get_coin[coin_count] = empty(address)
 
+    return coin_count
+
 
 @internal
 def _unregister_coin_pair(_coina: address, _coinb: address, _coinb_idx: uint256):
@@ -755,15 +790,16 @@ def _remove_market(_pool: address, _coina: address, _coinb: address):
             self._unregister_coin_pair(_coinb, _coina, indexes % 2 ** 128)
         self.coin_swap_indexes[key] = 0
 
-    for i in range(65536):
-        if i > length:
-            break
-        if self.markets[key][i] == _pool:
-            if i < length:
-                self.markets[key][i] = self.markets[key][length]
-            self.markets[key][length] = empty(address)
-            self.market_counts[key] = length
-            break
+    # swap _pool with the last pool in the market and pop it:
+    position: uint256 = self.market_positions[key][_pool]
+    if self.markets[key][position] == _pool:
+        if position < length:
+            last_pool: address = self.markets[key][length]
+            self.markets[key][position] = last_pool
+            self.market_positions[key][last_pool] = position
+        self.markets[key][length] = empty(address)
+        self.market_positions[key][_pool] = 0
+        self.market_counts[key] = length
 
 
 @internal
@@ -775,41 +811,30 @@ def _remove_liquidity_gauges(_pool: address):
             break
 
 
-# admin functions
-
-
-@external
-def add_pool(
+@internal
+def _add_pool(
     _pool: address,
     _lp_token: address,
     _gauge: address,
     _zap: address,
     _n_coins: uint256,
     _name: String[64],
-    _base_pool: address = empty(address),
-    _has_positive_rebasing_tokens: bool = False
-):
+    _base_pool: address,
+    _has_positive_rebasing_tokens: bool,
+    _pool_count: uint256,
+    _coin_count: uint256
+) -> uint256:
     """
-    @notice Add a pool to the registry
-    @dev Only callable by admin
-    @param _pool Pool address to add
-    @param _lp_token Pool deposit token address
-    @param _gauge Gauge address
-    @param _zap Zap address
-    @param _n_coins Number of coins in the pool
-    @param _name The name of the pool
-    @param _base_pool Address of base pool
-    @param _has_positive_rebasing_tokens pool contains positive rebasing tokens
+    @dev `_pool_count` and `_coin_count` are the current pool and unique coin
+         counts. The caller writes back `_pool_count + 1` and the returned
+         unique coin count, once per batch
     """
-    assert msg.sender == self.address_provider.admin()  # dev: admin-only function
     assert _lp_token != empty(address)
     assert self.get_pool_from_lp_token[_lp_token] == empty(address)  # dev: pool exists
 
     # initialise PoolArray struct
-    length: uint256 = self.pool_count
-    self.pool_list[length] = _pool
-    self.pool_count = length + 1
-    self.pool_data[_pool].location = length
+    self.pool_list[_pool_count] = _pool
+    self.pool_data[_pool].location = _pool_count
     self.pool_data[_pool].name = _name
     self.pool_data[_pool].n_coins = _n_coins
 
@@ -829,7 +854,7 @@ def add_pool(
         if i == convert(_n_coins, int128):
             break
         _coins[i] = CurvePool(_pool).coins(convert(i, uint256))
-    self._add_coins_to_market(_pool, _coins)
+    coin_count: uint256 = self._add_coins_to_market(_pool, _coins, _coin_count)
 
     # the following does not add basepool_lp_token <> underlying_coin mapping
     # since that is redundant:
@@ -840,24 +865,24 @@ def add_pool(
         _underlying_coins: address[MAX_COINS] = self._get_underlying_coins_for_metapool(_pool)
         assert _underlying_coins[0] != empty(address)
 
-        self._add_coins_to_market(_pool, _underlying_coins, True)
+        coin_count = self._add_coins_to_market(_pool, _underlying_coins, coin_count, True)
 
     if _has_positive_rebasing_tokens:
         self.pool_data[_pool].has_positive_rebasing_tokens = True
 
     # log pool added:
-    self.last_updated = block.timestamp
     log PoolAdded(_pool)
 
+    return coin_count
 
-@external
-def remove_pool(_pool: address):
+
+@internal
+def _remove_pool(_pool: address, _pool_count: uint256, _coin_count: uint256) -> uint256:
     """
-    @notice Remove a pool to the registry
-    @dev Only callable by admin
-    @param _pool Pool address to remove
+    @dev `_pool_count` and `_coin_count` are the current pool and unique coin
+         counts. The caller writes back `_pool_count - 1` and the returned
+         unique coin count, once per batch
     """
-    assert msg.sender == self.address_provider.admin()  # dev: admin-only function
     assert self.get_lp_token[_pool] != empty(address)  # dev: pool does not exist
 
     self.get_pool_from_lp_token[self.get_lp_token[_pool]] = empty(address)
@@ -865,7 +890,7 @@ def remove_pool(_pool: address):
 
     # remove _pool from pool_list
     location: uint256 = self.pool_data[_pool].location
-    length: uint256 = self.pool_count - 1
+    length: uint256 = _pool_count - 1
 
     # because self.pool_list is a static array,
     # we can replace the last index with empty(address)
@@ -880,8 +905,8 @@ def remove_pool(_pool: address):
 
     # delete final pool_list value
     self.pool_list[length] = empty(address)
-    self.pool_count = length
 
+    coin_count: uint256 = _coin_count
     coins: address[MAX_COINS] = self._get_coins(_pool)
     ucoins: address[MAX_COINS] = empty(address[MAX_COINS])
     is_meta: bool = self._is_meta(_pool)
@@ -894,11 +919,11 @@ def remove_pool(_pool: address):
             break
 
         if coins[i] != empty(address):
-            self._unregister_coin(coins[i])
+            coin_count = self._unregister_coin(coins[i], coin_count)
 
         if ucoins[i] != empty(address):
             if self.coins[ucoins[i]].register_count != 0:
-                self._unregister_coin(ucoins[i])
+                coin_count = self._unregister_coin(ucoins[i], coin_count)
 
         for j in range(MAX_COINS):
 
@@ -918,9 +943,125 @@ def remove_pool(_pool: address):
     self.get_zap[_pool] = empty(address)
     self._remove_liquidity_gauges(_pool)
 
-    self.last_updated = block.timestamp
     log PoolRemoved(_pool)
 
+    return coin_count
+
+
+# admin functions
+
+
+@external
+def add_pool(
+    _pool: address,
+    _lp_token: address,
+    _gauge: address,
+    _zap: address,
+    _n_coins: uint256,
+    _name: String[64],
+    _base_pool: address = empty(address),
+    _has_positive_rebasing_tokens: bool = False
+):
+    """
+    @notice Add a pool to the registry
+    @dev Only callable by admin
+    @param _pool Pool address to add
+    @param _lp_token Pool deposit token address
+    @param _gauge Gauge address
+    @param _zap Zap address
+    @param _n_coins Number of coins in the pool
+    @param _name The name of the pool
+    @param _base_pool Address of base pool
+    @param _has_positive_rebasing_tokens pool contains positive rebasing tokens
+    """
+    assert msg.sender == self.address_provider.admin()  # dev: admin-only function
+
+    pool_count: uint256 = self.pool_count
+    self.coin_count = self._add_pool(
+        _pool,
+        _lp_token,
+        _gauge,
+        _zap,
+        _n_coins,
+        _name,
+        _base_pool,
+        _has_positive_rebasing_tokens,
+        pool_count,
+        self.coin_count
+    )
+    self.pool_count = pool_count + 1
+    self.last_updated = block.timestamp
+
+
+@external
+def add_pools(_pools: DynArray[PoolParams, MAX_BATCH]):
+    """
+    @notice Add many pools to the registry in a single transaction
+    @dev Only callable by admin. Pools are added in the given order. Only
+         the admin check and the pool and coin count writes are shared by
+         the batch: every pool still registers its coins and coin pairs.
+    @param _pools List of pools to add, with the same fields as `add_pool`
+    """
+    assert msg.sender == self.address_provider.admin()  # dev: admin-only function
+
+    pool_count: uint256 = self.pool_count
+    coin_count: uint256 = self.coin_count
+    for params in _pools:
+        coin_count = self._add_pool(
+            params.pool,
+            params.lp_token,
+            params.gauge,
+            params.zap,
+            params.n_coins,
+            params.name,
+            params.base_pool,
+            params.has_positive_rebasing_tokens,
+            pool_count,
+            coin_count
+        )
+        pool_count += 1
+
+    self.pool_count = pool_count
+    self.coin_count = coin_count
+    self.last_updated = block.timestamp
+
+
+@external
+def remove_pool(_pool: address):
+    """
+    @notice Remove a pool to the registry
+    @dev Only callable by admin
+    @param _pool Pool address to remove
+    """
+    assert msg.sender == self.address_provider.admin()  # dev: admin-only function
+
+    pool_count: uint256 = self.pool_count
+    self.coin_count = self._remove_pool(_pool, pool_count, self.coin_count)
+    self.pool_count = pool_count - 1
+    self.last_updated = block.timestamp
+
+
+@external
+def remove_pools(_pools: DynArray[address, MAX_BATCH]):
+    """
+    @notice Remove many pools from the registry in a single transaction
+    @dev Only callable by admin. Only the admin check and the pool and coin
+         count writes are shared by the batch: every pool still unregisters
+         its coins and coin pairs.
+    @param _pools List of pool addresses to remove
+    """
+    assert msg.sender == self.address_provider.admin()  # dev: admin-only function
+
+    pool_count: uint256 = self.pool_count
+    coin_count: uint256 = self.coin_count
+    for pool in _pools:
+        coin_count = self._remove_pool(pool, pool_count, coin_count)
+        pool_count -= 1
+
+    self.pool_count = pool_count
+    self.coin_count = coin_count
+    self.last_updated = block.timestamp
+
 
 @external
 def set_liquidity_gauges(_pool: address, _liquidity_gauges: address[10]):
@@ -73,10 +73,25 @@ interface MetaRegistry:
     def registry_length() -> uint256: view
 
 
+# ---- structs ---- #
+struct PoolInfo:
+    coins: address[MAX_METAREGISTRY_COINS]
+    decimals: uint256[MAX_METAREGISTRY_COINS]
+    balances: uint256[MAX_METAREGISTRY_COINS]
+    underlying_coins: address[MAX_METAREGISTRY_COINS]
+    fees: uint256[10]
+    lp_token: address
+    gauge: address
+    is_meta: bool
+    asset_type: uint256
+    name: String[64]
+
+
 # ---- constants ---- #
 GAUGE_CONTROLLER: constant(address) = 0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB
 MAX_COINS: constant(uint256) = 2
 MAX_METAREGISTRY_COINS: constant(uint256) = 8
+MAX_BATCH: constant(uint256) = 100
 MAX_POOLS: constant(uint256) = 65536
 N_COINS: constant(uint256) = 2
 
@@ -85,6 +100,10 @@ N_COINS: constant(uint256) = 2
 base_registry: public(BaseRegistry)
 base_pool_registry: BasePoolRegistry
 
+# lp token -> pool, for the first `synced_pool_count` pools of the base registry:
+lp_token_pool: HashMap[address, address]
+synced_pool_count: public(uint256)
+
 
 # ---- constructor ---- #
 @external
@@ -180,33 +199,48 @@ def _is_meta(_pool: address) -> bool:
 
 @view
 @internal
-def _get_meta_underlying_balances(_pool: address) -> uint256[MAX_METAREGISTRY_COINS]:
-    base_coin_idx: uint256 = self._get_n_coins(_pool) - 1
-    base_pool: address = self._get_base_pool(_pool)
-    base_total_supply: uint256 = ERC20(self.base_pool_registry.get_lp_token(base_pool)).totalSupply()
+def _get_base_pool_balances(_base_pool: address) -> (uint256[MAX_METAREGISTRY_COINS], uint256, uint256):
+    base_n_coins: uint256 = self.base_pool_registry.get_n_coins(_base_pool)
+    base_total_supply: uint256 = ERC20(self.base_pool_registry.get_lp_token(_base_pool)).totalSupply()
+    is_legacy: bool = self.base_pool_registry.is_legacy(_base_pool)
+
+    base_balances: uint256[MAX_METAREGISTRY_COINS] = empty(uint256[MAX_METAREGISTRY_COINS])
+    for i in range(MAX_METAREGISTRY_COINS):
+        if i == base_n_coins:
+            break
+        if is_legacy:
+            base_balances[i] = StableSwapLegacy(_base_pool).balances(convert(i, int128))
+        else:
+            base_balances[i] = CurvePool(_base_pool).balances(i)
+
+    return base_balances, base_n_coins, base_total_supply
+
+
+@view
+@internal
+def _get_meta_underlying_balances(
+    _pool: address,
+    _base_balances: uint256[MAX_METAREGISTRY_COINS],
+    _base_n_coins: uint256,
+    _base_total_supply: uint256
+) -> uint256[MAX_METAREGISTRY_COINS]:
+    base_coin_idx: uint256 = N_COINS - 1
 
     ul_balance: uint256 = 0
     underlying_pct: uint256 = 0
-    if base_total_supply > 0:
-        underlying_pct = CurvePool(_pool).balances(base_coin_idx) * 10**36 / base_total_supply
+    if _base_total_supply > 0:
+        underlying_pct = CurvePool(_pool).balances(base_coin_idx) * 10**36 / _base_total_supply
 
     underlying_balances: uint256[MAX_METAREGISTRY_COINS] = empty(uint256[MAX_METAREGISTRY_COINS])
-    ul_coins: address[MAX_METAREGISTRY_COINS] = self._get_underlying_coins_for_metapool(_pool)
     for i in range(MAX_METAREGISTRY_COINS):
 
-        if ul_coins[i] == empty(address):
+        if i == base_coin_idx + _base_n_coins:
             break
 
         if i < base_coin_idx:
             ul_balance = CurvePool(_pool).balances(i)
-
         else:
-
-            if self.base_pool_registry.is_legacy(base_pool):
-                ul_balance = StableSwapLegacy(base_pool).balances(convert(i - base_coin_idx, int128))
-            else:
-                ul_balance = CurvePool(base_pool).balances(i - base_coin_idx)
-            ul_balance = ul_balance * underlying_pct / 10**36
+            ul_balance = _base_balances[i - base_coin_idx] * underlying_pct / 10**36
         underlying_balances[i] = ul_balance
 
     return underlying_balances
@@ -215,21 +249,49 @@ def _get_meta_underlying_balances(_pool: address) -> uint256[MAX_METAREGISTRY_CO
 @internal
 @view
 def _get_pool_from_lp_token(_lp_token: address) -> address:
+    pool: address = self.lp_token_pool[_lp_token]
+    if pool != empty(address):
+        return pool
+
+    # only pools deployed after the last sync need to be scanned:
     max_pools: uint256 = self.base_registry.pool_count()
-    for i in range(MAX_POOLS):
+    for i in range(self.synced_pool_count, self.synced_pool_count + MAX_POOLS):
         if i == max_pools:
             break
-        pool: address = self.base_registry.pool_list(i)
+        pool = self.base_registry.pool_list(i)
         token: address = self._get_lp_token(pool)
         if token == _lp_token:
             return pool
     return empty(address)
 
 
+@internal
+@view
+def _get_fees(_pool: address) -> uint256[10]:
+    fees: uint256[10] = empty(uint256[10])
+    pool_fees: uint256[4] = [CurvePool(_pool).fee(), CurvePool(_pool).admin_fee(), CurvePool(_pool).mid_fee(), CurvePool(_pool).out_fee()]
+    for i in range(4):
+        fees[i] = pool_fees[i]
+    return fees
+
+
+@internal
+@view
+def _get_pool_name(_pool: address) -> String[64]:
+    token: address = self._get_lp_token(_pool)
+    if token != empty(address):
+        return ERC20(token).name()
+    return ""
+
+
 @internal
 @view
 def _get_gauge_type(_gauge: address) -> int128:
 
+    # pools without a gauge are not registered in the gauge controller:
+    if _gauge == empty(address):
+        return 5
+
     # try to get gauge type registered in gauge controller
     success: bool = False
     response: Bytes[32] = b""
@@ -253,6 +315,27 @@ def _get_gauge_type(_gauge: address) -> int128:
     return 5
 
 
+# ---- permissionless methods ---- #
+@external
+def sync_lp_tokens(_count: uint256):
+    """
+    @notice Store the lp tokens of the next `_count` pools deployed by the factory
+    @dev Lp token lookups read synced pools from storage and only scan the
+         pools deployed since the last sync
+    @param _count Maximum number of pools to sync
+    """
+    pool_index: uint256 = self.synced_pool_count
+    max_pools: uint256 = self.base_registry.pool_count()
+    for i in range(MAX_POOLS):
+        if i == _count or pool_index == max_pools:
+            break
+        pool: address = self.base_registry.pool_list(pool_index)
+        self.lp_token_pool[self._get_lp_token(pool)] = pool
+        pool_index += 1
+
+    self.synced_pool_count = pool_index
+
+
 # ---- view methods (API) of the contract ---- #
 @external
 @view
@@ -272,8 +355,16 @@ def find_pool_for_coins(_from: address, _to: address, i: uint256 = 0) -> address
     if _pool != empty(address):
         return _pool
 
-    # could not find a pool for the coins for `i`. check if they are in a base pool:
-    _pools: address[1000] = empty(address[1000])
+    # pools are indexed as direct pairs first, then metapool pairs. there is no direct
+    # pair at index `i`, so we count the direct pairs before it and look for the
+    # metapool pair at index `i - num_pairs`:
+    num_pairs: uint256 = 0
+    for k in range(MAX_POOLS):
+        if k == i or self.base_registry.find_pool_for_coins(_from, _to, k) == empty(address):
+            break
+        num_pairs += 1
+
+    _pool_idx: uint256 = i - num_pairs
     _num_metapool_pairs: uint256 = 0
 
     for coin in [_from, _to]:
@@ -281,62 +372,32 @@ def find_pool_for_coins(_from: address, _to: address, i: uint256 = 0) -> address
         # we need to loop over several base pools because a coin can exist in multiple base pools
         base_pools: DynArray[address, 1000] = self.base_pool_registry.get_basepools_for_coin(coin)
 
-        if len(base_pools) == 0:
-            continue
-
         for _base_pool in base_pools:
 
             # found a base pool, but is it the right one?
-            if _base_pool != empty(address):
-
-                base_pool_lp_token: address = self.base_pool_registry.get_lp_token(_base_pool)
-
-                for k in range(100):
-
-                    if coin == _from:
-
-                        # check if the basepool containing the _from coin has a pair with the _to coin:
-                        _pool = self.base_registry.find_pool_for_coins(base_pool_lp_token, _to, k)
-
-                        if _pool == empty(address):
-                            break
-
-                        # only append if a pool is found:
-                        _pools[_num_metapool_pairs] = _pool
-                        _num_metapool_pairs += 1
+            if _base_pool == empty(address):
+                continue
 
-                    elif coin == _to:
+            base_pool_lp_token: address = self.base_pool_registry.get_lp_token(_base_pool)
 
-                        # check if the basepool containing the _to coin has a pair with the _from coin:
-                        _pool = self.base_registry.find_pool_for_coins(_from, base_pool_lp_token, k)
+            for k in range(100):
 
-                        if _pool == empty(address):
-                            break
+                if coin == _from:
+                    # check if the basepool containing the _from coin has a pair with the _to coin:
+                    _pool = self.base_registry.find_pool_for_coins(base_pool_lp_token, _to, k)
+                else:
+                    # check if the basepool containing the _to coin has a pair with the _from coin:
+                    _pool = self.base_registry.find_pool_for_coins(_from, base_pool_lp_token, k)
 
-                        # only append if a pool is found:
-                        _pools[_num_metapool_pairs] = _pool
-                        _num_metapool_pairs += 1
+                if _pool == empty(address):
+                    break
 
-    # say we found a pair for _from and _to in the base registry without a basepool combination already
-    # then that pool will be returned when i == 0. But if that same pair exists in a base pool then
-    # i == 1 will return empty(address) in the base_registry query, but i = 0 for _pools will return
-    # the metapool pair. But if we keep i == 1 for _pools, it would return empty(address) (unless there
-    # is another metapool pair of course). So, we first check how many direct pairs exist:
+                # stop as soon as the queried pair index is reached:
+                if _num_metapool_pairs == _pool_idx:
+                    return _pool
+                _num_metapool_pairs += 1
 
-    num_pairs: uint256 = 0
-    for k in range(20):
-        _pool = self.base_registry.find_pool_for_coins(_from, _to, k)
-        if _pool == empty(address):
-            break
-        num_pairs += 1
-
-    # now we check if the queried pair index `i` is higher than num_pairs. e.g. if num_pairs == 1 and i == 1,
-    # and _num_metapool_pairs == 1, then i >= num_pairs, and we return _pools[1 - num_pairs]. If there are
-    # no metapool pairs, then it will automatically return empty(address):
-    if i >= num_pairs:
-        return _pools[i - num_pairs]
-    else:
-        return _pools[i]
+    return empty(address)
 
 
 @external
@@ -421,49 +482,62 @@ def get_coin_indices(_pool: address, _from: address, _to: address) -> (uint256,
     # the return value is stored as `uint256[3]` to reduce gas costs
     # from index, to index, is the market underlying?
     result: uint256[3] = empty(uint256[3])
-    _coins: address[MAX_METAREGISTRY_COINS] = self._get_coins(_pool)
-    found_market: bool = False
+    _coins: address[MAX_COINS] = self.base_registry.get_coins(_pool)
+    found_from: bool = False
+    found_to: bool = False
 
     # check coin markets
-    for x in range(MAX_METAREGISTRY_COINS):
+    for x in range(MAX_COINS):
         coin: address = _coins[x]
         if coin == empty(address):
-            # if we reach the end of the coins, reset `found_market` and try again
-            # with the underlying coins
-            found_market = False
             break
         if coin == _from:
             result[0] = x
+            found_from = True
         elif coin == _to:
             result[1] = x
+            found_to = True
         else:
             continue
 
-        if found_market:
-            # the second time we find a match, break out of the loop
+        if found_from and found_to:
+            return result[0], result[1], False
+
+    # check underlying coin markets, reusing the coins fetched above:
+    base_pool: address = empty(address)
+    for coin in _coins:
+        base_pool = self.base_pool_registry.get_base_pool_for_lp_token(coin)
+        if base_pool != empty(address):
             break
-        # the first time we find a match, set `found_market` to True
-        found_market = True
-
-    if not found_market and self._is_meta(_pool):
-        # check underlying coin markets
-        underlying_coins: address[MAX_METAREGISTRY_COINS] = self._get_underlying_coins_for_metapool(_pool)
-        for x in range(MAX_METAREGISTRY_COINS):
-            coin: address = underlying_coins[x]
-            if coin == empty(address):
-                raise "No available market"
-            if coin == _from:
-                result[0] = x
-            elif coin == _to:
-                result[1] = x
-            else:
-                continue
 
-            if found_market:
-                result[2] = 1
-                break
-            found_market = True
+    if base_pool == empty(address):
+        return result[0], result[1], False
+
+    # underlying coins are the coins before the base pool lp token followed by
+    # the base pool coins: matches before the lp token are kept, and only the
+    # base pool coins are left to check.
+    base_coin_offset: uint256 = N_COINS - 1
+    found_from = found_from and result[0] < base_coin_offset
+    found_to = found_to and result[1] < base_coin_offset
+
+    base_pool_coins: address[MAX_METAREGISTRY_COINS] = self.base_pool_registry.get_coins(base_pool)
+    for x in range(MAX_METAREGISTRY_COINS - N_COINS + 1):
+        if found_from and found_to:
+            break
+        coin: address = base_pool_coins[x]
+        if coin == empty(address):
+            break
+        if coin == _from and not found_from:
+            result[0] = x + base_coin_offset
+            found_from = True
+        elif coin == _to and not found_to:
+            result[1] = x + base_coin_offset
+            found_to = True
+
+    if not (found_from and found_to):
+        raise "No available market"
 
+    result[2] = 1
     return result[0], result[1], result[2] > 0
 
 
@@ -501,11 +575,7 @@ def get_fees(_pool: address) -> uint256[10]:
             3. mid fee (fee when cryptoswap pool is pegged)
             4. out fee (fee when cryptoswap pool depegs)
     """
-    fees: uint256[10] = empty(uint256[10])
-    pool_fees: uint256[4] = [CurvePool(_pool).fee(), CurvePool(_pool).admin_fee(), CurvePool(_pool).mid_fee(), CurvePool(_pool).out_fee()]
-    for i in range(4):
-        fees[i] = pool_fees[i]
-    return fees
+    return self._get_fees(_pool)
 
 
 @external
@@ -588,15 +658,7 @@ def get_pool_from_lp_token(_lp_token: address) -> address:
     @param _lp_token Address of the Liquidity Provider token
     @return Address of the pool
     """
-    max_pools: uint256 = self.base_registry.pool_count()
-    for i in range(MAX_POOLS):
-        if i == max_pools:
-            break
-        pool: address = self.base_registry.pool_list(i)
-        token: address = self._get_lp_token(pool)
-        if token == _lp_token:
-            return pool
-    return empty(address)
+    return self._get_pool_from_lp_token(_lp_token)
 
 
 @external
@@ -607,11 +669,36 @@ def get_pool_name(_pool: address) -> String[64]:
     @param _pool Address of the pool
     @return String[64] Name of the pool
     """
-    token: address = self._get_lp_token(_pool)
-    if token != empty(address):
-        return ERC20(self.base_registry.get_token(_pool)).name()
-    else:
-        return ""
+    return self._get_pool_name(_pool)
+
+
+@external
+@view
+def get_pool_info(_pool: address) -> PoolInfo:
+    """
+    @notice Returns the coins, balances, fees and metadata of the given pool
+    @dev Gauge types are not included: use `get_gauges` for those
+    @param _pool Address of the pool
+    @return PoolInfo Info of the pool
+    """
+    coins: address[MAX_METAREGISTRY_COINS] = self._get_coins(_pool)
+    is_meta: bool = self._is_meta(_pool)
+    underlying_coins: address[MAX_METAREGISTRY_COINS] = coins
+    if is_meta:
+        underlying_coins = self._get_underlying_coins_for_metapool(_pool)
+
+    return PoolInfo({
+        coins: coins,
+        decimals: self._get_decimals(_pool),
+        balances: self._get_balances(_pool),
+        underlying_coins: underlying_coins,
+        fees: self._get_fees(_pool),
+        lp_token: self._get_lp_token(_pool),
+        gauge: self.base_registry.get_gauge(_pool),
+        is_meta: is_meta,
+        asset_type: 4,
+        name: self._get_pool_name(_pool),
+    })
 
 
 @external
@@ -643,9 +730,67 @@ def get_underlying_balances(_pool: address) -> uint256[MAX_METAREGISTRY_COINS]:
     @param _pool Address of the pool
     @return uint256[MAX_METAREGISTRY_COINS] Array of underlying balances
     """
-    if self._is_meta(_pool):
-        return self._get_meta_underlying_balances(_pool)
-    return self._get_balances(_pool)
+    base_pool: address = self._get_base_pool(_pool)
+    if base_pool == empty(address):
+        return self._get_balances(_pool)
+
+    base_balances: uint256[MAX_METAREGISTRY_COINS] = empty(uint256[MAX_METAREGISTRY_COINS])
+    base_n_coins: uint256 = 0
+    base_total_supply: uint256 = 0
+    base_balances, base_n_coins, base_total_supply = self._get_base_pool_balances(base_pool)
+    return self._get_meta_underlying_balances(_pool, base_balances, base_n_coins, base_total_supply)
+
+
+@external
+@view
+def get_underlying_balances_many(
+    _pools: DynArray[address, MAX_BATCH]
+) -> DynArray[uint256[MAX_METAREGISTRY_COINS], MAX_BATCH]:
+    """
+    @notice Returns the underlying balances of a list of pools
+    @dev Base pools shared by several metapools are only read once
+    @param _pools Addresses of the pools
+    @return DynArray of underlying balances of each pool
+    """
+    base_pools: DynArray[address, MAX_BATCH] = []
+    base_balances: DynArray[uint256[MAX_METAREGISTRY_COINS], MAX_BATCH] = []
+    base_n_coins: DynArray[uint256, MAX_BATCH] = []
+    base_total_supplies: DynArray[uint256, MAX_BATCH] = []
+
+    underlying_balances: DynArray[uint256[MAX_METAREGISTRY_COINS], MAX_BATCH] = []
+    for pool in _pools:
+
+        base_pool: address = self._get_base_pool(pool)
+        if base_pool == empty(address):
+            underlying_balances.append(self._get_balances(pool))
+            continue
+
+        k: uint256 = len(base_pools)
+        for j in range(MAX_BATCH):
+            if j == len(base_pools):
+                break
+            if base_pools[j] == base_pool:
+                k = j
+                break
+
+        if k == len(base_pools):
+            balances: uint256[MAX_METAREGISTRY_COINS] = empty(uint256[MAX_METAREGISTRY_COINS])
+            n_coins: uint256 = 0
+            total_supply: uint256 = 0
+            balances, n_coins, total_supply = self._get_base_pool_balances(base_pool)
+            base_pools.append(base_pool)
+            base_balances.append(balances)
+            base_n_coins.append(n_coins)
+            base_total_supplies.append(total_supply)
+
+        underlying_balances.append(
+            self._get_meta_underlying_balances(
+                pool, base_balances[k], base_n_coins[k], base_total_supplies[k]
+            )
+        )
+
+    return underlying_balances
+
 
 @external
 @view
@@ -58,8 +58,23 @@ interface MetaRegistry:
     def registry_length() -> uint256: view
 
 
+# ---- structs ---- #
+struct PoolInfo:
+    coins: address[MAX_COINS]
+    decimals: uint256[MAX_COINS]
+    balances: uint256[MAX_COINS]
+    underlying_coins: address[MAX_COINS]
+    fees: uint256[10]
+    lp_token: address
+    gauge: address
+    is_meta: bool
+    asset_type: uint256
+    name: String[64]
+
+
 # ---- constants ---- #
 MAX_COINS: constant(uint256) = 8
+MAX_BATCH: constant(uint256) = 100
 
 # ---- storage variables ---- #
 base_registry: public(BaseRegistry)
@@ -80,6 +95,16 @@ def _get_lp_token(_pool: address) -> address:
     return self.base_registry.get_lp_token(_pool)
 
 
+@internal
+@view
+def _get_fees(_pool: address) -> uint256[10]:
+    fees: uint256[10] = empty(uint256[10])
+    pool_fees: uint256[4] = self.base_registry.get_fees(_pool)
+    for i in range(4):
+        fees[i] = pool_fees[i]
+    return fees
+
+
 # ---- view methods (API) of the contract ---- #
 @external
 @view
@@ -173,11 +198,7 @@ def get_fees(_pool: address) -> uint256[10]:
         Mid fee
         Out fee
     """
-    fees: uint256[10] = empty(uint256[10])
-    pool_fees: uint256[4] = self.base_registry.get_fees(_pool)
-    for i in range(4):
-        fees[i] = pool_fees[i]
-    return fees
+    return self._get_fees(_pool)
 
 
 @external
@@ -258,6 +279,29 @@ def get_pool_name(_pool: address) -> String[64]:
     return self.base_registry.get_pool_name(_pool)
 
 
+@external
+@view
+def get_pool_info(_pool: address) -> PoolInfo:
+    """
+    @notice Get the coins, balances, fees and metadata of the given pool.
+    @dev Only the first gauge is returned, and without its gauge type.
+    @param _pool The address of the pool.
+    @return The info of the pool.
+    """
+    return PoolInfo({
+        coins: self.base_registry.get_coins(_pool),
+        decimals: self.base_registry.get_decimals(_pool),
+        balances: self.base_registry.get_balances(_pool),
+        underlying_coins: self.base_registry.get_underlying_coins(_pool),
+        fees: self._get_fees(_pool),
+        lp_token: self._get_lp_token(_pool),
+        gauge: self.base_registry.get_gauges(_pool)[0][0],
+        is_meta: self.base_registry.is_meta(_pool),
+        asset_type: 4,
+        name: self.base_registry.get_pool_name(_pool),
+    })
+
+
 @external
 @view
 def get_pool_params(_pool: address) -> uint256[20]:
@@ -290,6 +334,22 @@ def get_underlying_balances(_pool: address) -> uint256[MAX_COINS]:
     return self.base_registry.get_underlying_balances(_pool)
 
 
+@external
+@view
+def get_underlying_balances_many(
+    _pools: DynArray[address, MAX_BATCH]
+) -> DynArray[uint256[MAX_COINS], MAX_BATCH]:
+    """
+    @notice Get the underlying balances of a list of pools.
+    @param _pools The addresses of the pools.
+    @return The underlying balances of each pool.
+    """
+    underlying_balances: DynArray[uint256[MAX_COINS], MAX_BATCH] = []
+    for pool in _pools:
+        underlying_balances.append(self.base_registry.get_underlying_balances(pool))
+    return underlying_balances
+
+
 @external
 @view
 def get_underlying_coins(_pool: address) -> address[MAX_COINS]:
@@ -68,10 +68,25 @@ interface MetaRegistry:
     def registry_length() -> uint256: view
 
 
+# ---- structs ---- #
+struct PoolInfo:
+    coins: address[MAX_METAREGISTRY_COINS]
+    decimals: uint256[MAX_METAREGISTRY_COINS]
+    balances: uint256[MAX_METAREGISTRY_COINS]
+    underlying_coins: address[MAX_METAREGISTRY_COINS]
+    fees: uint256[10]
+    lp_token: address
+    gauge: address
+    is_meta: bool
+    asset_type: uint256
+    name: String[64]
+
+
 # ---- constants ---- #
 GAUGE_CONTROLLER: constant(address) = 0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB
 MAX_COINS: constant(uint256) = 4
 MAX_METAREGISTRY_COINS: constant(uint256) = 8
+MAX_BATCH: constant(uint256) = 100
 
 
 # ---- storage variables ---- #
@@ -135,33 +150,49 @@ def _get_base_pool(_pool: address) -> address:
 
 @view
 @internal
-def _get_meta_underlying_balances(_pool: address) -> uint256[MAX_METAREGISTRY_COINS]:
-    base_coin_idx: uint256 = self._get_n_coins(_pool) - 1
-    base_pool: address = self._get_base_pool(_pool)
-    base_total_supply: uint256 = ERC20(self.base_pool_registry.get_lp_token(base_pool)).totalSupply()
+def _get_base_pool_balances(_base_pool: address) -> (uint256[MAX_METAREGISTRY_COINS], uint256, uint256):
+    base_n_coins: uint256 = self.base_pool_registry.get_n_coins(_base_pool)
+    base_total_supply: uint256 = ERC20(self.base_pool_registry.get_lp_token(_base_pool)).totalSupply()
+    is_legacy: bool = self.base_pool_registry.is_legacy(_base_pool)
+
+    base_balances: uint256[MAX_METAREGISTRY_COINS] = empty(uint256[MAX_METAREGISTRY_COINS])
+    for i in range(MAX_METAREGISTRY_COINS):
+        if i == base_n_coins:
+            break
+        if is_legacy:
+            base_balances[i] = CurveLegacyPool(_base_pool).balances(convert(i, int128))
+        else:
+            base_balances[i] = CurvePool(_base_pool).balances(i)
+
+    return base_balances, base_n_coins, base_total_supply
+
+
+@view
+@internal
+def _get_meta_underlying_balances(
+    _pool: address,
+    _base_balances: uint256[MAX_METAREGISTRY_COINS],
+    _base_n_coins: uint256,
+    _base_total_supply: uint256
+) -> uint256[MAX_METAREGISTRY_COINS]:
+    # stable factory metapools pair one coin with the base pool lp token:
+    base_coin_idx: uint256 = 1
 
     ul_balance: uint256 = 0
     underlying_pct: uint256 = 0
-    if base_total_supply > 0:
-        underlying_pct = CurvePool(_pool).balances(base_coin_idx) * 10**36 / base_total_supply
+    if _base_total_supply > 0:
+        underlying_pct = CurvePool(_pool).balances(base_coin_idx) * 10**36 / _base_total_supply
 
     underlying_balances: uint256[MAX_METAREGISTRY_COINS] = empty(uint256[MAX_METAREGISTRY_COINS])
-    ul_coins: address[MAX_METAREGISTRY_COINS] = self._get_underlying_coins(_pool)
-    for i in range(MAX_METAREGISTRY_COINS):
+    for i in range(MAX_COINS):
 
-        if ul_coins[i] == empty(address):
+        if i == base_coin_idx + _base_n_coins:
             break
 
         if i < base_coin_idx:
             ul_balance = CurvePool(_pool).balances(i)
-
         else:
-
-            if self.base_pool_registry.is_legacy(base_pool):
-                ul_balance = CurveLegacyPool(base_pool).balances(convert(i - base_coin_idx, int128))
-            else:
-                ul_balance = CurvePool(base_pool).balances(i - base_coin_idx)
-            ul_balance = ul_balance * underlying_pct / 10**36
+            ul_balance = _base_balances[i - base_coin_idx] * underlying_pct / 10**36
         underlying_balances[i] = ul_balance
 
     return underlying_balances
@@ -188,10 +219,33 @@ def _get_decimals(_pool: address) -> uint256[MAX_METAREGISTRY_COINS]:
     return self._pad_uint_array(self.base_registry.get_decimals(_pool))
 
 
+@internal
+@view
+def _get_fees(_pool: address) -> uint256[10]:
+    fees: uint256[10] = empty(uint256[10])
+    pool_fees: uint256[2] = self.base_registry.get_fees(_pool)
+    for i in range(2):
+        fees[i] = pool_fees[i]
+    return fees
+
+
+@internal
+@view
+def _get_pool_name(_pool: address) -> String[64]:
+    if self._get_n_coins(_pool) == 0:
+        # _pool is not in base registry, so we ignore:
+        return ""
+    return ERC20(_pool).name()
+
+
 @internal
 @view
 def _get_gauge_type(_gauge: address) -> int128:
 
+    # pools without a gauge are not registered in the gauge controller:
+    if _gauge == empty(address):
+        return 0
+
     success: bool = False
     response: Bytes[32] = b""
     success, response = raw_call(
@@ -271,20 +325,31 @@ def get_coin_indices(_pool: address, _from: address, _to: address) -> (int128, i
     """
     coin1: int128 = 0
     coin2: int128 = 0
-    is_underlying: bool = False
+    found_from: bool = False
+    found_to: bool = False
 
+    # a market between the pool's own coins is never underlying, and its
+    # indices are resolved from the coins without further calls:
+    _coins: address[MAX_COINS] = self.base_registry.get_coins(_pool)
+    for x in range(MAX_COINS):
+        coin: address = _coins[x]
+        if coin == empty(address):
+            break
+        if coin == _from:
+            coin1 = convert(x, int128)
+            found_from = True
+        elif coin == _to:
+            coin2 = convert(x, int128)
+            found_to = True
+
+        if found_from and found_to:
+            return (coin1, coin2, False)
+
+    # due to a bug in original factory contract, `is_underlying`` is always True.
+    # the factory reverts unless the coins are an underlying market of a metapool,
+    # so a market it resolves here is always underlying:
     (coin1, coin2) = self.base_registry.get_coin_indices(_pool, _from, _to)
-
-    # due to a bug in original factory contract, `is_underlying`` is always True
-    # to fix this, we first check if it is a metapool, and if not then we return
-    # False. If so, then we check if basepool lp token is one of the two coins,
-    # in which case `is_underlying` would be False
-    if self._is_meta(_pool):
-        base_pool_lp_token: address = self.base_registry.get_coins(_pool)[1]
-        if base_pool_lp_token not in [_from, _to]:
-            is_underlying = True
-
-    return (coin1, coin2, is_underlying)
+    return (coin1, coin2, True)
 
 
 @external
@@ -317,11 +382,7 @@ def get_fees(_pool: address) -> uint256[10]:
     @param _pool address of the pool
     @return fees of the pool
     """
-    fees: uint256[10] = empty(uint256[10])
-    pool_fees: uint256[2] = self.base_registry.get_fees(_pool)
-    for i in range(2):
-        fees[i] = pool_fees[i]
-    return fees
+    return self._get_fees(_pool)
 
 
 @external
@@ -436,10 +497,36 @@ def get_pool_name(_pool: address) -> String[64]:
     @dev stable factory pools are ERC20 tokenized
     @return name of the pool
     """
-    if self._get_n_coins(_pool) == 0:
-        # _pool is not in base registry, so we ignore:
-        return ""
-    return ERC20(_pool).name()
+    return self._get_pool_name(_pool)
+
+
+@external
+@view
+def get_pool_info(_pool: address) -> PoolInfo:
+    """
+    @notice Get the coins, balances, fees and metadata of the pool
+    @dev Gauge types are not included: use `get_gauges` for those
+    @param _pool address of the pool
+    @return info of the pool
+    """
+    coins: address[MAX_METAREGISTRY_COINS] = self._get_coins(_pool)
+    is_meta: bool = self._is_meta(_pool)
+    underlying_coins: address[MAX_METAREGISTRY_COINS] = coins
+    if is_meta:
+        underlying_coins = self._get_underlying_coins(_pool)
+
+    return PoolInfo({
+        coins: coins,
+        decimals: self._get_decimals(_pool),
+        balances: self._get_balances(_pool),
+        underlying_coins: underlying_coins,
+        fees: self._get_fees(_pool),
+        lp_token: _pool,
+        gauge: self.base_registry.get_gauge(_pool),
+        is_meta: is_meta,
+        asset_type: self.base_registry.get_pool_asset_type(_pool),
+        name: self._get_pool_name(_pool),
+    })
 
 
 @external
@@ -465,7 +552,63 @@ def get_underlying_balances(_pool: address) -> uint256[MAX_METAREGISTRY_COINS]:
     """
     if not self._is_meta(_pool):
         return self._get_balances(_pool)
-    return self._get_meta_underlying_balances(_pool)
+
+    base_balances: uint256[MAX_METAREGISTRY_COINS] = empty(uint256[MAX_METAREGISTRY_COINS])
+    base_n_coins: uint256 = 0
+    base_total_supply: uint256 = 0
+    base_balances, base_n_coins, base_total_supply = self._get_base_pool_balances(self._get_base_pool(_pool))
+    return self._get_meta_underlying_balances(_pool, base_balances, base_n_coins, base_total_supply)
+
+
+@external
+@view
+def get_underlying_balances_many(
+    _pools: DynArray[address, MAX_BATCH]
+) -> DynArray[uint256[MAX_METAREGISTRY_COINS], MAX_BATCH]:
+    """
+    @notice Get the underlying balances of a list of pools
+    @dev Base pools shared by several metapools are only read once
+    @param _pools addresses of the pools
+    @return underlying balances of each pool
+    """
+    base_pools: DynArray[address, MAX_BATCH] = []
+    base_balances: DynArray[uint256[MAX_METAREGISTRY_COINS], MAX_BATCH] = []
+    base_n_coins: DynArray[uint256, MAX_BATCH] = []
+    base_total_supplies: DynArray[uint256, MAX_BATCH] = []
+
+    underlying_balances: DynArray[uint256[MAX_METAREGISTRY_COINS], MAX_BATCH] = []
+    for pool in _pools:
+
+        if not self._is_meta(pool):
+            underlying_balances.append(self._get_balances(pool))
+            continue
+
+        base_pool: address = self._get_base_pool(pool)
+        k: uint256 = len(base_pools)
+        for j in range(MAX_BATCH):
+            if j == len(base_pools):
+                break
+            if base_pools[j] == base_pool:
+                k = j
+                break
+
+        if k == len(base_pools):
+            balances: uint256[MAX_METAREGISTRY_COINS] = empty(uint256[MAX_METAREGISTRY_COINS])
+            n_coins: uint256 = 0
+            total_supply: uint256 = 0
+            balances, n_coins, total_supply = self._get_base_pool_balances(base_pool)
+            base_pools.append(base_pool)
+            base_balances.append(balances)
+            base_n_coins.append(n_coins)
+            base_total_supplies.append(total_supply)
+
+        underlying_balances.append(
+            self._get_meta_underlying_balances(
+                pool, base_balances[k], base_n_coins[k], base_total_supplies[k]
+            )
+        )
+
+    return underlying_balances
 
 
 @external
@@ -40,8 +40,23 @@ interface MetaRegistry:
     def registry_length() -> uint256: view
 
 
+# ---- structs ---- #
+struct PoolInfo:
+    coins: address[MAX_COINS]
+    decimals: uint256[MAX_COINS]
+    balances: uint256[MAX_COINS]
+    underlying_coins: address[MAX_COINS]
+    fees: uint256[10]
+    lp_token: address
+    gauge: address
+    is_meta: bool
+    asset_type: uint256
+    name: String[64]
+
+
 # ---- constants ---- #
 MAX_COINS: constant(uint256) = 8
+MAX_BATCH: constant(uint256) = 100
 
 
 # ---- storage variables ---- #
@@ -67,6 +82,24 @@ def _is_meta(_pool: address) -> bool:
     return self.base_registry.is_meta(_pool)
 
 
+@internal
+@view
+def _get_fees(_pool: address) -> uint256[10]:
+    fees: uint256[10] = empty(uint256[10])
+    pool_fees: uint256[2] = self.base_registry.get_fees(_pool)
+    for i in range(2):
+        fees[i] = pool_fees[i]
+    return fees
+
+
+@internal
+@view
+def _get_underlying_balances(_pool: address) -> uint256[MAX_COINS]:
+    if not self._is_meta(_pool):
+        return self.base_registry.get_balances(_pool)
+    return self.base_registry.get_underlying_balances(_pool)
+
+
 # ---- view methods (API) of the contract ---- #
 @external
 @view
@@ -160,11 +193,7 @@ def get_fees(_pool: address) -> uint256[10]:
     @param _pool address of pool.
     @return fees of the pool.
     """
-    fees: uint256[10] = empty(uint256[10])
-    pool_fees: uint256[2] = self.base_registry.get_fees(_pool)
-    for i in range(2):
-        fees[i] = pool_fees[i]
-    return fees
+    return self._get_fees(_pool)
 
 
 @external
@@ -245,6 +274,29 @@ def get_pool_name(_pool: address) -> String[64]:
     return self.base_registry.get_pool_name(_pool)
 
 
+@external
+@view
+def get_pool_info(_pool: address) -> PoolInfo:
+    """
+    @notice Get the coins, balances, fees and metadata of the given pool.
+    @dev Only the first gauge is returned, and without its gauge type.
+    @param _pool address of pool.
+    @return info of the pool.
+    """
+    return PoolInfo({
+        coins: self.base_registry.get_coins(_pool),
+        decimals: self.base_registry.get_decimals(_pool),
+        balances: self.base_registry.get_balances(_pool),
+        underlying_coins: self.base_registry.get_underlying_coins(_pool),
+        fees: self._get_fees(_pool),
+        lp_token: self.base_registry.get_lp_token(_pool),
+        gauge: self.base_registry.get_gauges(_pool)[0][0],
+        is_meta: self._is_meta(_pool),
+        asset_type: self.base_registry.get_pool_asset_type(_pool),
+        name: self.base_registry.get_pool_name(_pool),
+    })
+
+
 @external
 @view
 def get_pool_params(_pool: address) -> uint256[20]:
@@ -267,9 +319,23 @@ def get_underlying_balances(_pool: address) -> uint256[MAX_COINS]:
     @param _pool address of pool.
     @return underlying balances of the pool.
     """
-    if not self._is_meta(_pool):
-        return self.base_registry.get_balances(_pool)
-    return self.base_registry.get_underlying_balances(_pool)
+    return self._get_underlying_balances(_pool)
+
+
+@external
+@view
+def get_underlying_balances_many(
+    _pools: DynArray[address, MAX_BATCH]
+) -> DynArray[uint256[MAX_COINS], MAX_BATCH]:
+    """
+    @notice Get the underlying balances of a list of pools.
+    @param _pools addresses of the pools.
+    @return underlying balances of each pool.
+    """
+    underlying_balances: DynArray[uint256[MAX_COINS], MAX_BATCH] = []
+    for pool in _pools:
+        underlying_balances.append(self._get_underlying_balances(pool))
+    return underlying_balances
 
 
 @external
@@ -27,6 +27,7 @@ ADDRESS_PROVIDER_MAPPING = {
     23: "Emergency Admin",
     24: "CurveDAO Vault",  # Holds funds
     25: "crvUSD Token",
+    26: "Base Pool Registry",
 }
 
 # These are the addresses that will go into the addressprovider for each chain:
@@ -0,0 +1,76 @@
+"""
+Benchmarks the batched gauge getters of MetaRegistryL2 on a fork.
+
+Compares per-pool get_gauge calls against get_gauges_many, before and after
+cache_gauges, on a fresh MetaRegistryL2 set up with the registry handlers of
+the network's deployed Metaregistry. EVM networks only: the benchmark reads
+gas from boa's local fork, which zksync does not support.
+
+Usage:
+    python -m scripts.benchmark_metaregistryl2_gauges <network>
+"""
+
+import sys
+
+import boa
+from rich import console as rich_console
+
+from scripts.deploy_addressprovider_and_setup import fetch_url
+from scripts.deploy_metaregistryl2 import ADDRESS_PROVIDER
+from tests.utils import get_last_call_gas_used
+
+console = rich_console.Console()
+
+MAX_POOLS = 100
+
+
+def main(network):
+    boa.env.fork(fetch_url(network))
+    console.log(f"Forkmode on {network} ...")
+
+    address_provider = boa.load_partial("contracts/AddressProviderNG.vy").at(
+        ADDRESS_PROVIDER
+    )
+    deployed_metaregistry = boa.load_partial("contracts/MetaRegistryL2.vy").at(
+        address_provider.get_address(7)
+    )
+
+    metaregistry = boa.load(
+        "contracts/MetaRegistryL2.vy",
+        deployed_metaregistry.gauge_factory(),
+        deployed_metaregistry.gauge_type(),
+    )
+    for i in range(deployed_metaregistry.registry_length()):
+        metaregistry.add_registry_handler(
+            deployed_metaregistry.get_registry(i)
+        )
+
+    pools = [
+        metaregistry.pool_list(i)
+        for i in range(min(metaregistry.pool_count(), MAX_POOLS))
+    ]
+    if not pools:
+        console.log("No pools to benchmark.")
+        return
+
+    single_gas = 0
+    for pool in pools:
+        metaregistry.get_gauge(pool)
+        single_gas += get_last_call_gas_used(metaregistry)
+
+    metaregistry.get_gauges_many(pools)
+    batch_gas = get_last_call_gas_used(metaregistry)
+
+    metaregistry.cache_gauges(pools)
+    metaregistry.get_gauges_many(pools)
+    cached_batch_gas = get_last_call_gas_used(metaregistry)
+
+    console.log(
+        f"Gauges for {len(pools)} pools: {single_gas} gas with get_gauge, "
+        f"{batch_gas} gas with get_gauges_many, "
+        f"{cached_batch_gas} gas with get_gauges_many after cache_gauges"
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
@@ -22,6 +22,9 @@ from scripts.utils.constants import (
 
 RICH_CONSOLE = RichConsole(file=sys.stdout)
 
+# maximum number of pools CryptoRegistryV1.add_pools takes at once:
+CRYPTO_REGISTRY_BATCH_SIZE = 20
+
 # TODO: Metaregistry and Base Pool Registry no longer have a dependency AddressProvider's admin.
 # Adjust the code accordingly:
 
@@ -119,40 +122,52 @@ def main():
 
     # populate crypto registry:
     crypto_pool_index = 0
+    pools_to_add = []
     for _, pool in CRYPTO_REGISTRY_POOLS.items():
-        # check if base pool already exists in the registry:
+        # check if pool already exists in the registry:
         entry_at_index = crypto_registry.pool_list(crypto_pool_index).lower()
         if entry_at_index == pool["pool"].lower():
             crypto_pool_index += 1
             continue
+        pools_to_add.append(pool)
+
+    for start in range(0, len(pools_to_add), CRYPTO_REGISTRY_BATCH_SIZE):
+        pools = pools_to_add[start : start + CRYPTO_REGISTRY_BATCH_SIZE]
 
         # set up tx calldata for proxy admin:
-        call_data = crypto_registry.add_pool.as_transaction(
-            pool["pool"],
-            pool["lp_token"],
-            pool["gauge"],
-            pool["zap"],
-            pool["num_coins"],
-            pool["name"],
-            pool["base_pool"],
-            pool["has_positive_rebasing_tokens"],
+        call_data = crypto_registry.add_pools.as_transaction(
+            [
+                (
+                    pool["pool"],
+                    pool["lp_token"],
+                    pool["gauge"],
+                    pool["zap"],
+                    pool["num_coins"],
+                    pool["name"],
+                    pool["base_pool"],
+                    pool["has_positive_rebasing_tokens"],
+                )
+                for pool in pools
+            ],
             sender=address_provider_admin,
         ).data
 
-        # add pool to registry:
+        # add pools to registry:
         tx = proxy_admin.execute(crypto_registry, call_data, sender=account)
         total_gas_used += tx.gas_used
 
         # check if deployment is correct:
-        assert (
-            crypto_registry.pool_list(crypto_pool_index).lower()
-            == pool["pool"].lower()
-        )
+        for pool in pools:
+            assert (
+                crypto_registry.pool_list(crypto_pool_index).lower()
+                == pool["pool"].lower()
+            )
+            crypto_pool_index += 1
+
         RICH_CONSOLE.log(
-            f"Added pool [blue]{pool['pool']} to crypto registry. "
+            f"Added {len(pools)} pools to crypto registry. "
             f"Gas used: [green]{tx.gas_used}"
         )
-        crypto_pool_index += 1
 
     # populate metaregistry:
     registry_handler_index = 0
@@ -173,6 +173,22 @@ def populated_metaregistry(metaregistry, handlers, owner):
     return metaregistry
 
 
+@pytest.fixture(scope="module")
+def rate_provider_address_provider(populated_metaregistry, owner):
+    address_provider = deploy_contract("AddressProviderNG", sender=owner)
+    address_provider.add_new_id(
+        7, populated_metaregistry.address, "Metaregistry", sender=owner
+    )
+    return address_provider
+
+
+@pytest.fixture(scope="module")
+def rate_provider(rate_provider_address_provider, owner):
+    return deploy_contract(
+        "RateProvider", rate_provider_address_provider.address, sender=owner
+    )
+
+
 @pytest.fixture(scope="module")
 def stable_registry_handler_index():
     return 0
@@ -0,0 +1,38 @@
+import boa
+from eth_abi import decode
+from eth_utils import function_signature_to_4byte_selector
+
+from tests.utils import get_last_call_gas_used
+
+GET_BALANCES = function_signature_to_4byte_selector("get_balances(address)")
+
+
+def test_call_handler(populated_metaregistry, handlers):
+    for handler_index, handler in enumerate(handlers):
+        pool = handler.pool_list(0)
+        response = populated_metaregistry.call_handler(
+            handler_index, GET_BALANCES, pool
+        )
+        assert list(decode(["uint256[8]"], response)[0]) == list(
+            handler.get_balances(pool)
+        )
+
+
+def test_call_handler_invalid_index(populated_metaregistry, handlers):
+    with boa.reverts():
+        populated_metaregistry.call_handler(
+            len(handlers), GET_BALANCES, handlers[0].pool_list(0)
+        )
+
+
+def test_call_handler_gas(populated_metaregistry, handlers):
+    for handler_index, handler in enumerate(handlers):
+        pool = handler.pool_list(0)
+
+        populated_metaregistry.get_balances(pool)
+        resolved_gas = get_last_call_gas_used(populated_metaregistry)
+
+        populated_metaregistry.call_handler(handler_index, GET_BALANCES, pool)
+        dispatched_gas = get_last_call_gas_used(populated_metaregistry)
+
+        assert dispatched_gas < resolved_gas
@@ -0,0 +1,29 @@
+import pytest
+
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+USDT = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+
+
+@pytest.mark.parametrize("limit", [1, 3, 10, 1000])
+def test_paginated_pools_match_all_pools(populated_metaregistry, limit):
+    all_pools = populated_metaregistry.find_pools_for_coins(USDC, USDT)
+
+    pools = []
+    cursor = 0
+    while True:
+        page, cursor = populated_metaregistry.find_pools_for_coins_paginated(
+            USDC, USDT, cursor, limit
+        )
+        assert len(page) <= limit
+        pools += page
+        if cursor == 0:
+            break
+
+    assert pools == all_pools
+
+
+def test_get_pool_count_for_coins(populated_metaregistry):
+    all_pools = populated_metaregistry.find_pools_for_coins(USDC, USDT)
+    assert populated_metaregistry.get_pool_count_for_coins(USDC, USDT) == len(
+        all_pools
+    )
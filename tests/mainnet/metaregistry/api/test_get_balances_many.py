@@ -0,0 +1,82 @@
+from eth.constants import ZERO_ADDRESS
+
+
+def _get_pools(metaregistry, n_pools=10):
+    return [metaregistry.pool_list(i) for i in range(n_pools)]
+
+
+def test_get_balances_many(populated_metaregistry):
+    pools = _get_pools(populated_metaregistry)
+    successes, balances = populated_metaregistry.get_balances_many(pools)
+
+    assert all(successes)
+    assert balances == [
+        list(populated_metaregistry.get_balances(pool)) for pool in pools
+    ]
+
+
+def test_get_underlying_balances_many(populated_metaregistry):
+    pools = _get_pools(populated_metaregistry)
+    successes, balances = populated_metaregistry.get_underlying_balances_many(
+        pools
+    )
+
+    assert all(successes)
+    assert balances == [
+        list(populated_metaregistry.get_underlying_balances(pool))
+        for pool in pools
+    ]
+
+
+def test_get_underlying_balances_many_across_handlers(
+    populated_metaregistry, handlers, random_address
+):
+    pools = [handler.pool_list(i) for handler in handlers for i in range(3)]
+    pools.insert(1, random_address)
+    successes, balances = populated_metaregistry.get_underlying_balances_many(
+        pools
+    )
+
+    assert successes == [pool != random_address for pool in pools]
+    assert balances[1] == [0] * 8
+    for pool, pool_balances in zip(pools, balances):
+        if pool != random_address:
+            assert pool_balances == list(
+                populated_metaregistry.get_underlying_balances(pool)
+            )
+
+
+def test_get_admin_balances_many(populated_metaregistry):
+    pools = _get_pools(populated_metaregistry)
+    successes, balances = populated_metaregistry.get_admin_balances_many(pools)
+
+    assert all(successes)
+    assert balances == [
+        list(populated_metaregistry.get_admin_balances(pool)) for pool in pools
+    ]
+
+
+def test_get_virtual_prices_many(populated_metaregistry):
+    pools = _get_pools(populated_metaregistry)
+    successes, virtual_prices = populated_metaregistry.get_virtual_prices_many(
+        pools
+    )
+
+    assert all(successes)
+    assert virtual_prices == [
+        populated_metaregistry.get_virtual_price_from_lp_token(
+            populated_metaregistry.get_lp_token(pool)
+        )
+        for pool in pools
+    ]
+
+
+def test_unregistered_pool_does_not_revert_batch(
+    populated_metaregistry, random_address
+):
+    pools = [ZERO_ADDRESS, populated_metaregistry.pool_list(0), random_address]
+    successes, balances = populated_metaregistry.get_balances_many(pools)
+
+    assert successes == [False, True, False]
+    assert balances[0] == balances[2] == [0] * 8
+    assert balances[1] == list(populated_metaregistry.get_balances(pools[1]))
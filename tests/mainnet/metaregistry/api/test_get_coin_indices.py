@@ -4,6 +4,8 @@ import warnings
 import pytest
 from eth.constants import ZERO_ADDRESS
 
+from tests.utils import get_last_call_gas_used
+
 
 def _reject_pools_with_one_coin(metaregistry, pool):
     pool_coins = [
@@ -180,3 +182,18 @@ def test_crypto_factory_pools(
             crypto_factory_pool,
             max_coins,
         )
+
+
+def test_get_coin_indices_gas(handlers):
+    gas_used = {}
+    for handler in handlers:
+        pool = handler.pool_list(0)
+        coins = [
+            coin for coin in handler.get_coins(pool) if coin != ZERO_ADDRESS
+        ]
+
+        handler.get_coin_indices(pool, coins[0], coins[1])
+        gas_used[handler.address] = get_last_call_gas_used(handler)
+
+    # coins are fetched once, so a direct market is a handful of calls:
+    assert all(gas < 50_000 for gas in gas_used.values())
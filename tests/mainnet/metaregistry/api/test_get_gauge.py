@@ -131,3 +131,26 @@ def test_crypto_factory_pools(
 
     assert actual_output[0][0] == metaregistry_output_gauge
     assert metaregistry_output_gauge_type == 5
+
+
+def test_get_gauge_and_type(populated_metaregistry, pool):
+    assert populated_metaregistry.get_gauge_and_type(pool) == (
+        populated_metaregistry.get_gauge(pool),
+        populated_metaregistry.get_gauge_type(pool),
+    )
+
+
+def test_get_gauges_many(populated_metaregistry, random_address):
+    pools = [populated_metaregistry.pool_list(i) for i in range(10)]
+    successes, gauges, gauge_types = populated_metaregistry.get_gauges_many(
+        pools + [random_address]
+    )
+
+    assert successes == [True] * len(pools) + [False]
+    assert gauges[:-1] == [
+        populated_metaregistry.get_gauge(pool) for pool in pools
+    ]
+    assert gauge_types[:-1] == [
+        populated_metaregistry.get_gauge_type(pool) for pool in pools
+    ]
+    assert (gauges[-1], gauge_types[-1]) == (ZERO_ADDRESS, 0)
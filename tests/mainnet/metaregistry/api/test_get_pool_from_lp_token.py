@@ -4,3 +4,20 @@ def test_all_pools(populated_metaregistry, pool):
         lp_token
     )
     assert pool == metaregistry_output
+
+
+def test_crypto_factory_synced_lp_tokens(
+    populated_metaregistry, crypto_factory_handler, crypto_factory
+):
+    pool_count = crypto_factory.pool_count()
+    crypto_factory_handler.sync_lp_tokens(pool_count - 1)
+    assert crypto_factory_handler.synced_pool_count() == pool_count - 1
+
+    # synced pools are read from storage, the last one is scanned:
+    for pool in [
+        crypto_factory.pool_list(0),
+        crypto_factory.pool_list(pool_count - 1),
+    ]:
+        lp_token = crypto_factory.get_token(pool)
+        assert crypto_factory_handler.get_pool_from_lp_token(lp_token) == pool
+        assert populated_metaregistry.get_pool_from_lp_token(lp_token) == pool
@@ -0,0 +1,26 @@
+def test_get_pool_info(populated_metaregistry, pool):
+    (
+        coins,
+        decimals,
+        balances,
+        underlying_coins,
+        fees,
+        lp_token,
+        gauge,
+        is_meta,
+        asset_type,
+        name,
+    ) = populated_metaregistry.get_pool_info(pool)
+
+    assert coins == populated_metaregistry.get_coins(pool)
+    assert decimals == populated_metaregistry.get_decimals(pool)
+    assert balances == populated_metaregistry.get_balances(pool)
+    assert underlying_coins == populated_metaregistry.get_underlying_coins(
+        pool
+    )
+    assert fees == populated_metaregistry.get_fees(pool)
+    assert lp_token == populated_metaregistry.get_lp_token(pool)
+    assert gauge == populated_metaregistry.get_gauge(pool)
+    assert is_meta == populated_metaregistry.is_meta(pool)
+    assert asset_type == populated_metaregistry.get_pool_asset_type(pool)
+    assert name == populated_metaregistry.get_pool_name(pool)
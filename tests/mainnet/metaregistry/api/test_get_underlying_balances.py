@@ -168,3 +168,13 @@ def test_crypto_factory_pools(
         populated_base_pool_registry,
         max_coins,
     )
+
+
+def test_handlers_underlying_balances_many(handlers):
+    for handler in handlers:
+        pools = [
+            handler.pool_list(i) for i in range(min(handler.pool_count(), 20))
+        ]
+        assert handler.get_underlying_balances_many(pools) == [
+            list(handler.get_underlying_balances(pool)) for pool in pools
+        ]
@@ -0,0 +1,73 @@
+import boa
+
+from tests.utils import deploy_contract
+
+
+def test_add_registry_handler_logs_new_pools(owner, stable_registry_handler):
+    metaregistry = deploy_contract("MetaRegistry", sender=owner)
+    metaregistry.add_registry_handler(
+        stable_registry_handler.address, sender=owner
+    )
+
+    handler_added, checkpoint = metaregistry.get_logs()
+    assert handler_added.event_type.name == "RegistryHandlerAdded"
+    assert handler_added.topics == [0, stable_registry_handler.address]
+
+    assert checkpoint.event_type.name == "PoolCountCheckpoint"
+    assert checkpoint.topics == [0, stable_registry_handler.address]
+    assert checkpoint.args == (0, stable_registry_handler.pool_count())
+
+
+def test_update_registry_handler_logs_handlers(
+    owner, stable_registry_handler, stable_factory_handler
+):
+    metaregistry = deploy_contract("MetaRegistry", sender=owner)
+    metaregistry.add_registry_handler(
+        stable_registry_handler.address, sender=owner
+    )
+    metaregistry.update_registry_handler(
+        0, stable_factory_handler.address, sender=owner
+    )
+
+    handler_updated, checkpoint = metaregistry.get_logs()
+    assert handler_updated.event_type.name == "RegistryHandlerUpdated"
+    assert handler_updated.topics == [
+        0,
+        stable_registry_handler.address,
+        stable_factory_handler.address,
+    ]
+    assert checkpoint.args == (0, stable_factory_handler.pool_count())
+
+
+def test_checkpoint_without_new_pools(populated_metaregistry):
+    handler_pool_counts = [
+        populated_metaregistry.handler_pool_count(i)
+        for i in range(populated_metaregistry.registry_length())
+    ]
+
+    populated_metaregistry.checkpoint()
+
+    assert populated_metaregistry.get_logs() == []
+    assert [
+        populated_metaregistry.handler_pool_count(i)
+        for i in range(populated_metaregistry.registry_length())
+    ] == handler_pool_counts
+
+
+def test_checkpoint_after_removed_pool(
+    owner, crypto_registry, crypto_registry_handler
+):
+    metaregistry = deploy_contract("MetaRegistry", sender=owner)
+    metaregistry.add_registry_handler(
+        crypto_registry_handler.address, sender=owner
+    )
+    pool_count = metaregistry.pool_count()
+    epoch = metaregistry.handler_epoch()
+
+    with boa.env.anchor():
+        crypto_registry.remove_pool(metaregistry.pool_list(0), sender=owner)
+        metaregistry.checkpoint()
+
+        (checkpoint,) = metaregistry.get_logs()
+        assert checkpoint.args == (pool_count, pool_count - 1)
+        assert metaregistry.handler_epoch() == epoch + 1
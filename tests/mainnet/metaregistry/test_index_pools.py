@@ -0,0 +1,89 @@
+from itertools import combinations
+
+import boa
+import pytest
+from eth.constants import ZERO_ADDRESS
+
+
+@pytest.fixture(scope="module")
+def crypto_metaregistry(metaregistry, crypto_registry_handler, owner):
+    metaregistry.add_registry_handler(
+        crypto_registry_handler.address, sender=owner
+    )
+    return metaregistry
+
+
+def _get_coin_pairs(metaregistry, n_pools=10):
+    pairs = set()
+    for i in range(min(metaregistry.pool_count(), n_pools)):
+        coins = [
+            coin
+            for coin in metaregistry.get_coins(metaregistry.pool_list(i))
+            if coin != ZERO_ADDRESS
+        ]
+        pairs.update(combinations(coins, 2))
+    return sorted(pairs)
+
+
+def _index_all_pools(metaregistry):
+    pool_count = metaregistry.handler_pool_count(0)
+    for start in range(0, pool_count, 100):
+        metaregistry.index_pools(0, start, 100)
+
+
+def test_revert_index_pools_out_of_order(crypto_metaregistry):
+    with boa.reverts():
+        crypto_metaregistry.index_pools(0, 1, 1)
+
+
+def test_index_pools_matches_scan(crypto_metaregistry):
+    pairs = _get_coin_pairs(crypto_metaregistry)
+    scanned_pools = [
+        crypto_metaregistry.find_pools_for_coins(coin_a, coin_b)
+        for coin_a, coin_b in pairs
+    ]
+
+    _index_all_pools(crypto_metaregistry)
+
+    for (coin_a, coin_b), pools in zip(pairs, scanned_pools):
+        indexed_pools = crypto_metaregistry.find_pools_for_coins(
+            coin_a, coin_b
+        )
+        assert indexed_pools == pools
+        assert crypto_metaregistry.get_pool_count_for_coins(
+            coin_a, coin_b
+        ) == len(indexed_pools)
+        assert [
+            crypto_metaregistry.find_pool_for_coins(coin_a, coin_b, i)
+            for i in range(len(indexed_pools))
+        ] == indexed_pools
+
+
+def test_update_registry_handler_resets_index(
+    crypto_metaregistry, crypto_registry_handler, owner
+):
+    _index_all_pools(crypto_metaregistry)
+    crypto_metaregistry.update_registry_handler(
+        0, crypto_registry_handler.address, sender=owner
+    )
+
+    epoch = crypto_metaregistry.handler_epoch()
+    assert crypto_metaregistry.indexed_pool_count(epoch, 0) == 0
+
+
+def test_removed_pool_resets_index(
+    crypto_metaregistry, crypto_registry, owner
+):
+    _index_all_pools(crypto_metaregistry)
+    pool = crypto_metaregistry.pool_list(0)
+    coin_a, coin_b = crypto_metaregistry.get_coins(pool)[:2]
+
+    with boa.env.anchor():
+        crypto_registry.remove_pool(pool, sender=owner)
+        epoch = crypto_metaregistry.handler_epoch()
+        crypto_metaregistry.checkpoint()
+
+        assert crypto_metaregistry.handler_epoch() == epoch + 1
+        assert pool not in crypto_metaregistry.find_pools_for_coins(
+            coin_a, coin_b
+        )
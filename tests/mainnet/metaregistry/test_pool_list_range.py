@@ -0,0 +1,74 @@
+import boa
+from eth.constants import ZERO_ADDRESS
+
+from tests.utils import deploy_contract
+
+
+def test_pool_count_matches_handlers(populated_metaregistry):
+    handler_pool_counts = [
+        populated_metaregistry.handler_pool_count(i)
+        for i in range(populated_metaregistry.registry_length())
+    ]
+    assert populated_metaregistry.pool_count() == sum(handler_pool_counts)
+
+
+def test_pool_list_range(populated_metaregistry):
+    n_pools = 50
+    pools = [populated_metaregistry.pool_list(i) for i in range(n_pools)]
+
+    assert populated_metaregistry.pool_list_range(0, n_pools) == pools
+    assert populated_metaregistry.pool_list_range(10, 20) == pools[10:30]
+
+
+def test_pool_list_range_across_handlers(
+    populated_metaregistry, stable_registry_handler_index
+):
+    first_handler_pools = populated_metaregistry.handler_pool_count(
+        stable_registry_handler_index
+    )
+    start = first_handler_pools - 5
+    pools = [
+        populated_metaregistry.pool_list(i) for i in range(start, start + 10)
+    ]
+
+    assert populated_metaregistry.pool_list_range(start, 10) == pools
+
+
+def test_pool_list_range_past_last_pool(populated_metaregistry):
+    pool_count = populated_metaregistry.pool_count()
+
+    pools = populated_metaregistry.pool_list_range(pool_count - 2, 10)
+    assert pools == [
+        populated_metaregistry.pool_list(pool_count - 2),
+        populated_metaregistry.pool_list(pool_count - 1),
+    ]
+    assert populated_metaregistry.pool_list_range(pool_count, 10) == []
+
+
+def test_revert_pool_list_range_too_many_pools(populated_metaregistry):
+    with boa.reverts():
+        populated_metaregistry.pool_list_range(0, 1001)
+
+
+def test_pool_list_after_handler_pool_count_shrinks(
+    crypto_registry, crypto_registry_handler, owner
+):
+    metaregistry = deploy_contract("MetaRegistry", sender=owner)
+    metaregistry.add_registry_handler(
+        crypto_registry_handler.address, sender=owner
+    )
+    pool_count = metaregistry.pool_count()
+    pools = metaregistry.pool_list_range(0, pool_count)
+
+    with boa.env.anchor():
+        crypto_registry.remove_pool(pools[-1], sender=owner)
+
+        # the cached count is stale until the next checkpoint:
+        assert metaregistry.pool_count() == pool_count
+        assert metaregistry.pool_list(pool_count - 1) == ZERO_ADDRESS
+        assert metaregistry.pool_list_range(0, pool_count) == pools[:-1] + [
+            ZERO_ADDRESS
+        ]
+
+        metaregistry.checkpoint()
+        assert metaregistry.pool_list_range(0, pool_count) == pools[:-1]
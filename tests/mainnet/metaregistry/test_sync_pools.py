@@ -0,0 +1,99 @@
+import boa
+
+from tests.utils import deploy_contract, get_last_call_gas_used
+
+
+def test_revert_sync_pools_invalid_handler(populated_metaregistry):
+    with boa.reverts():
+        populated_metaregistry.sync_pools(10, 0, 1)
+
+
+def test_sync_pools_does_not_change_lookups(populated_metaregistry):
+    pools = [
+        populated_metaregistry.pool_list(i)
+        for i in range(min(populated_metaregistry.pool_count(), 20))
+    ]
+    handlers_before = [
+        populated_metaregistry.get_registry_handlers_from_pool(pool)
+        for pool in pools
+    ]
+
+    for handler_id in range(populated_metaregistry.registry_length()):
+        populated_metaregistry.sync_pools(handler_id, 0, 20)
+
+    handlers_after = [
+        populated_metaregistry.get_registry_handlers_from_pool(pool)
+        for pool in pools
+    ]
+    assert handlers_before == handlers_after
+
+
+def test_synced_lookup_is_cheaper(
+    populated_metaregistry, stable_registry_handler_index
+):
+    pool = populated_metaregistry.pool_list(0)
+
+    populated_metaregistry.get_n_coins(pool)
+    scan_gas = get_last_call_gas_used(populated_metaregistry)
+
+    populated_metaregistry.sync_pools(stable_registry_handler_index, 0, 1)
+    populated_metaregistry.get_n_coins(pool)
+    indexed_gas = get_last_call_gas_used(populated_metaregistry)
+
+    assert indexed_gas < scan_gas
+
+
+def test_update_registry_handler_invalidates_index(
+    populated_metaregistry,
+    stable_registry_handler,
+    stable_registry_handler_index,
+    owner,
+):
+    pool = populated_metaregistry.pool_list(0)
+    populated_metaregistry.sync_pools(stable_registry_handler_index, 0, 1)
+    epoch = populated_metaregistry.handler_epoch()
+
+    populated_metaregistry.update_registry_handler(
+        stable_registry_handler_index,
+        stable_registry_handler.address,
+        sender=owner,
+    )
+
+    assert populated_metaregistry.handler_epoch() == epoch + 1
+    assert (
+        populated_metaregistry.get_registry_handlers_from_pool(pool)[0]
+        == stable_registry_handler.address
+    )
+
+
+def test_removed_pool_is_not_routed_to_synced_handler(
+    crypto_registry, crypto_registry_handler, owner
+):
+    metaregistry = deploy_contract("MetaRegistry", sender=owner)
+    metaregistry.add_registry_handler(
+        crypto_registry_handler.address, sender=owner
+    )
+    pool = crypto_registry.pool_list(0)
+    metaregistry.sync_pools(0, 0, 1)
+
+    with boa.env.anchor():
+        crypto_registry.remove_pool(pool, sender=owner)
+
+        with boa.reverts("no registry"):
+            metaregistry.get_n_coins(pool)
+
+
+def test_sync_pool(crypto_registry, crypto_registry_handler, owner):
+    metaregistry = deploy_contract("MetaRegistry", sender=owner)
+    metaregistry.add_registry_handler(
+        crypto_registry_handler.address, sender=owner
+    )
+    pool = crypto_registry.pool_list(0)
+
+    metaregistry.sync_pool(pool)
+
+    assert metaregistry.get_n_coins(pool) == crypto_registry.get_n_coins(pool)
+    assert (
+        metaregistry.get_registry_handlers_from_pool(pool)[0]
+        == crypto_registry_handler.address
+    )
@@ -0,0 +1,23 @@
+import boa
+
+from tests.utils import deploy_contract
+
+
+def test_cache_pool_types(rate_provider, populated_metaregistry):
+    pools = [populated_metaregistry.pool_list(i) for i in range(10)]
+    pool_types = [rate_provider.get_pool_type(pool) for pool in pools]
+
+    rate_provider.cache_pool_types(pools)
+
+    assert [rate_provider.get_pool_type(pool) for pool in pools] == pool_types
+
+
+def test_revert_cache_pool_types_not_a_contract(rate_provider):
+    with boa.reverts(dev="not a contract"):
+        rate_provider.cache_pool_types([boa.env.generate_address()])
+
+
+def test_revert_cache_pool_types_unregistered_pool(rate_provider, owner):
+    unregistered_contract = deploy_contract("MetaRegistry", sender=owner)
+    with boa.reverts("no registry"):
+        rate_provider.cache_pool_types([unregistered_contract.address])
@@ -0,0 +1,48 @@
+from tests.utils import get_last_call_gas_used
+
+AMOUNT_OUT = 3
+SOURCE_TOKEN_POOL_BALANCE = 5
+DEST_TOKEN_POOL_BALANCE = 6
+
+
+def test_aggregated_rate_with_decimals(rate_provider, tokens):
+    rate = rate_provider.get_aggregated_rate(tokens["usdc"], tokens["usdt"])
+    assert 0.98 * 10**6 < rate < 1.02 * 10**6
+
+    assert (
+        rate_provider.get_aggregated_rate_with_decimals(
+            tokens["usdc"], tokens["usdt"], 6, 6
+        )
+        == rate
+    )
+
+
+def test_aggregated_rate_with_more_than_18_decimals(rate_provider, tokens):
+    quotes = rate_provider.get_quotes(tokens["usdc"], tokens["usdt"], 10**6)
+    # balances of a 24 decimals token are scaled down to 18 decimals:
+    weights = [
+        quote[SOURCE_TOKEN_POOL_BALANCE] * 10**12
+        + quote[DEST_TOKEN_POOL_BALANCE] // 10**6
+        for quote in quotes
+    ]
+    expected_rate = sum(
+        weight * quote[AMOUNT_OUT] for weight, quote in zip(weights, quotes)
+    ) // sum(weights)
+
+    assert (
+        rate_provider.get_aggregated_rate_with_decimals(
+            tokens["usdc"], tokens["usdt"], 6, 24
+        )
+        == expected_rate
+    )
+
+
+def test_aggregated_rate_gas(rate_provider, tokens):
+    quotes = rate_provider.get_quotes(tokens["usdc"], tokens["usdt"], 10**6)
+    quotes_gas = get_last_call_gas_used(rate_provider)
+
+    rate_provider.get_aggregated_rate(tokens["usdc"], tokens["usdt"])
+    aggregation_gas = get_last_call_gas_used(rate_provider) - quotes_gas
+
+    # two decimals() calls and a single pass over the quotes:
+    assert aggregation_gas < 5_000 + 3_000 * len(quotes)
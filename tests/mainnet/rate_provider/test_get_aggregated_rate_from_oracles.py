@@ -0,0 +1,49 @@
+import pytest
+
+POOL = 4
+AMOUNT_OUT = 3
+
+RATE_SOURCE_GET_DY = 0
+RATE_SOURCE_PRICE_ORACLE = 1
+RATE_SOURCE_LAST_PRICES = 2
+
+
+@pytest.mark.parametrize(
+    "use_last_prices,oracle_source",
+    [(False, RATE_SOURCE_PRICE_ORACLE), (True, RATE_SOURCE_LAST_PRICES)],
+)
+def test_oracle_rates(rate_provider, tokens, use_last_prices, oracle_source):
+    (
+        rate,
+        quotes,
+        rate_sources,
+    ) = rate_provider.get_aggregated_rate_from_oracles(
+        tokens["weth"], tokens["usdt"], use_last_prices
+    )
+
+    assert oracle_source in rate_sources
+    assert len(quotes) == len(rate_sources)
+
+    # oracle prices stay close to the simulated rate:
+    get_dy_rate = rate_provider.get_aggregated_rate(
+        tokens["weth"], tokens["usdt"]
+    )
+    assert 0.95 * get_dy_rate < rate < 1.05 * get_dy_rate
+
+
+def test_get_dy_rates(rate_provider, tokens):
+    _, quotes, rate_sources = rate_provider.get_aggregated_rate_from_oracles(
+        tokens["usdc"], tokens["usdt"]
+    )
+    get_dy_quotes = {
+        quote[POOL]: quote[AMOUNT_OUT]
+        for quote in rate_provider.get_quotes(
+            tokens["usdc"], tokens["usdt"], 10**6
+        )
+    }
+
+    # 3pool has no oracle and is simulated with get_dy:
+    assert RATE_SOURCE_GET_DY in rate_sources
+    for quote, rate_source in zip(quotes, rate_sources):
+        if rate_source == RATE_SOURCE_GET_DY:
+            assert quote[AMOUNT_OUT] == get_dy_quotes[quote[POOL]]
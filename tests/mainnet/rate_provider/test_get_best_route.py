@@ -0,0 +1,100 @@
+import boa
+import pytest
+from eth.constants import ZERO_ADDRESS
+
+AMOUNT_OUT = 3
+POOL = 4
+BASE_POOL_REGISTRY_ID = 26
+
+
+@pytest.fixture(scope="module")
+def route_rate_provider(
+    rate_provider,
+    rate_provider_address_provider,
+    populated_base_pool_registry,
+    owner,
+):
+    rate_provider_address_provider.add_new_id(
+        BASE_POOL_REGISTRY_ID,
+        populated_base_pool_registry.address,
+        "Base Pool Registry",
+        sender=owner,
+    )
+    return rate_provider
+
+
+def _get_best_quote(rate_provider, source_token, destination_token, amount):
+    quotes = rate_provider.get_quotes(source_token, destination_token, amount)
+    return max(
+        ((quote[POOL], quote[AMOUNT_OUT]) for quote in quotes),
+        key=lambda quote: quote[1],
+        default=(ZERO_ADDRESS, 0),
+    )
+
+
+def test_get_best_route_one_hop(route_rate_provider, tokens):
+    coins, pools, amount_out = route_rate_provider.get_best_route(
+        tokens["usdc"], tokens["usdt"], 10**6, 1, 10
+    )
+
+    assert coins[1] == ZERO_ADDRESS
+    assert (pools[0], amount_out) == _get_best_quote(
+        route_rate_provider, tokens["usdc"], tokens["usdt"], 10**6
+    )
+
+
+@pytest.mark.parametrize(
+    "source,destination", [("dai", "wbtc"), ("usdc", "weth")]
+)
+def test_get_best_route_two_hops(
+    route_rate_provider, tokens, source, destination
+):
+    source_token, destination_token = tokens[source], tokens[destination]
+    amount_in = 1000 * 10**18 if source == "dai" else 1000 * 10**6
+    coins, pools, amount_out = route_rate_provider.get_best_route(
+        source_token, destination_token, amount_in, 2, 10
+    )
+    _, direct_amount_out = _get_best_quote(
+        route_rate_provider, source_token, destination_token, amount_in
+    )
+
+    assert amount_out > 0
+    assert amount_out >= direct_amount_out
+    if coins[1] != ZERO_ADDRESS:
+        first_pool, intermediate_amount = _get_best_quote(
+            route_rate_provider, source_token, coins[1], amount_in
+        )
+        assert pools[0] == first_pool
+        assert (pools[1], amount_out) == _get_best_quote(
+            route_rate_provider,
+            coins[1],
+            destination_token,
+            intermediate_amount,
+        )
+
+
+def test_get_best_route_without_base_pool_registry(
+    route_rate_provider, rate_provider_address_provider, tokens, owner
+):
+    with boa.env.anchor():
+        rate_provider_address_provider.remove_id(
+            BASE_POOL_REGISTRY_ID, sender=owner
+        )
+        _, _, amount_out = route_rate_provider.get_best_route(
+            tokens["usdc"], tokens["weth"], 1000 * 10**6, 2, 10
+        )
+    _, direct_amount_out = _get_best_quote(
+        route_rate_provider, tokens["usdc"], tokens["weth"], 1000 * 10**6
+    )
+
+    assert amount_out >= direct_amount_out
+
+
+@pytest.mark.parametrize("max_hops", [0, 3])
+def test_revert_get_best_route_invalid_max_hops(
+    route_rate_provider, tokens, max_hops
+):
+    with boa.reverts(dev="invalid max_hops"):
+        route_rate_provider.get_best_route(
+            tokens["usdc"], tokens["usdt"], 10**6, max_hops, 10
+        )
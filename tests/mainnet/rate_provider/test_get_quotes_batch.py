@@ -0,0 +1,46 @@
+import boa
+
+AMOUNTS_OUT = 3
+POOL = 4
+
+
+def _get_quoted_amounts(
+    rate_provider, source_token, destination_token, amount
+):
+    return {
+        quote[POOL]: quote[AMOUNTS_OUT]
+        for quote in rate_provider.get_quotes(
+            source_token, destination_token, amount
+        )
+    }
+
+
+def test_get_quotes_batch_matches_get_quotes(rate_provider, tokens):
+    pairs = [
+        (tokens["usdc"], tokens["usdt"]),
+        (tokens["dai"], tokens["usdc"]),
+    ]
+    amounts_in = [[10**6, 10**9], [10**18, 10**21]]
+
+    ladders = rate_provider.get_quotes_batch(pairs, amounts_in)
+
+    assert len(ladders) == len(pairs)
+    for (source_token, destination_token), amounts, pair_ladders in zip(
+        pairs, amounts_in, ladders
+    ):
+        assert len(pair_ladders) > 0
+        for k, amount in enumerate(amounts):
+            assert {
+                ladder[POOL]: ladder[AMOUNTS_OUT][k]
+                for ladder in pair_ladders
+                if ladder[AMOUNTS_OUT][k] > 0
+            } == _get_quoted_amounts(
+                rate_provider, source_token, destination_token, amount
+            )
+
+
+def test_revert_get_quotes_batch_mismatched_lengths(rate_provider, tokens):
+    with boa.reverts(dev="pairs and amounts mismatch"):
+        rate_provider.get_quotes_batch(
+            [(tokens["usdc"], tokens["usdt"])], [[10**6], [10**6]]
+        )
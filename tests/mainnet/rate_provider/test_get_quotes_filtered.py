@@ -0,0 +1,72 @@
+import boa
+import pytest
+
+AMOUNT_OUT = 3
+POOL = 4
+SOURCE_TOKEN_POOL_BALANCE = 5
+DEST_TOKEN_POOL_BALANCE = 6
+
+
+def _get_liquidity(quote):
+    # usdc and usdt both have 6 decimals:
+    return (
+        quote[SOURCE_TOKEN_POOL_BALANCE] + quote[DEST_TOKEN_POOL_BALANCE]
+    ) * 10**12
+
+
+@pytest.fixture(scope="module")
+def usdc_usdt_quotes(rate_provider, tokens):
+    quotes = rate_provider.get_quotes(tokens["usdc"], tokens["usdt"], 10**6)
+    return sorted(quotes, key=_get_liquidity, reverse=True)
+
+
+def test_get_quotes_filtered_matches_get_quotes(
+    rate_provider, tokens, usdc_usdt_quotes
+):
+    quotes = rate_provider.get_quotes_filtered(
+        tokens["usdc"], tokens["usdt"], 10**6, 0, 100
+    )
+
+    assert [quote[POOL] for quote in quotes] == [
+        quote[POOL] for quote in usdc_usdt_quotes
+    ]
+    assert [quote[AMOUNT_OUT] for quote in quotes] == [
+        quote[AMOUNT_OUT] for quote in usdc_usdt_quotes
+    ]
+
+
+def test_get_quotes_filtered_max_pools(
+    rate_provider, tokens, usdc_usdt_quotes
+):
+    quotes = rate_provider.get_quotes_filtered(
+        tokens["usdc"], tokens["usdt"], 10**6, 0, 2
+    )
+
+    assert [quote[POOL] for quote in quotes] == [
+        quote[POOL] for quote in usdc_usdt_quotes[:2]
+    ]
+
+
+def test_get_quotes_filtered_min_liquidity(
+    rate_provider, tokens, usdc_usdt_quotes
+):
+    min_liquidity = _get_liquidity(usdc_usdt_quotes[1])
+    quotes = rate_provider.get_quotes_filtered(
+        tokens["usdc"], tokens["usdt"], 10**6, min_liquidity, 100
+    )
+
+    assert [quote[POOL] for quote in quotes] == [
+        quote[POOL]
+        for quote in usdc_usdt_quotes
+        if _get_liquidity(quote) >= min_liquidity
+    ]
+
+
+@pytest.mark.parametrize("max_pools", [0, 101])
+def test_revert_get_quotes_filtered_invalid_max_pools(
+    rate_provider, tokens, max_pools
+):
+    with boa.reverts(dev="invalid max_pools"):
+        rate_provider.get_quotes_filtered(
+            tokens["usdc"], tokens["usdt"], 10**6, 0, max_pools
+        )
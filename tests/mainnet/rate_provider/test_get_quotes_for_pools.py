@@ -0,0 +1,26 @@
+def test_get_quotes_for_pools_matches_get_quotes(
+    rate_provider, populated_metaregistry, tokens
+):
+    source_token, destination_token = tokens["usdc"], tokens["usdt"]
+    pools = populated_metaregistry.find_pools_for_coins(
+        source_token, destination_token
+    )
+
+    assert rate_provider.get_quotes_for_pools(
+        source_token, destination_token, 10**6, pools
+    ) == rate_provider.get_quotes(source_token, destination_token, 10**6)
+
+
+def test_get_quotes_for_pool_subset(
+    rate_provider, populated_metaregistry, tokens
+):
+    source_token, destination_token = tokens["usdc"], tokens["usdt"]
+    quotes = rate_provider.get_quotes(source_token, destination_token, 10**6)
+    pools = [quote[4] for quote in quotes[::2]]
+
+    assert (
+        rate_provider.get_quotes_for_pools(
+            source_token, destination_token, 10**6, pools
+        )
+        == quotes[::2]
+    )
@@ -142,3 +142,43 @@ def test_remove_base_pool(populated_base_pool_registry, owner, base_pools):
         == last_base_pool
     )
     assert populated_base_pool_registry.get_n_coins(tripool_address) == 0
+
+
+def test_basepools_for_coin(populated_base_pool_registry, tokens):
+    usdc_base_pools = populated_base_pool_registry.get_basepools_for_coin(
+        tokens["usdc"]
+    )
+    assert len(usdc_base_pools) > 0
+    for i, base_pool in enumerate(usdc_base_pools):
+        assert tokens["usdc"] in populated_base_pool_registry.get_coins(
+            base_pool
+        )
+        assert (
+            populated_base_pool_registry.get_basepool_for_coin(
+                tokens["usdc"], i
+            )
+            == base_pool
+        )
+
+
+def test_remove_base_pool_updates_basepools_for_coin(
+    populated_base_pool_registry, owner, base_pools, tokens
+):
+    btc_basepool = base_pools["sbtc"]["pool"]
+    assert btc_basepool in populated_base_pool_registry.get_basepools_for_coin(
+        tokens["wbtc"]
+    )
+
+    populated_base_pool_registry.remove_base_pool(btc_basepool, sender=owner)
+
+    for coin in ("renbtc", "wbtc", "sbtc"):
+        assert (
+            btc_basepool
+            not in populated_base_pool_registry.get_basepools_for_coin(
+                tokens[coin]
+            )
+        )
+    assert (
+        populated_base_pool_registry.get_coins(btc_basepool)
+        == [ZERO_ADDRESS] * 8
+    )
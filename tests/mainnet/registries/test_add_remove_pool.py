@@ -1,7 +1,7 @@
 import boa
 from eth.constants import ZERO_ADDRESS
 
-from tests.utils import deploy_contract
+from tests.utils import deploy_contract, get_last_call_gas_used
 
 
 def test_revert_unauthorised_add_pool(
@@ -234,3 +234,143 @@ def test_remove_pool(
                 0,
                 False,
             )
+
+
+def _pool_params(pool_data):
+    return (
+        pool_data["pool"],
+        pool_data["lp_token"],
+        pool_data["gauge"],
+        pool_data["zap"],
+        pool_data["num_coins"],
+        pool_data["name"],
+        pool_data["base_pool"],
+        pool_data["has_positive_rebasing_tokens"],
+    )
+
+
+def test_revert_unauthorised_add_pools(
+    crypto_registry, unauthorised_address, crypto_registry_pools
+):
+    with boa.reverts():
+        crypto_registry.add_pools(
+            [_pool_params(crypto_registry_pools["tricrypto2"])],
+            sender=unauthorised_address,
+        )
+
+
+def test_add_pools(
+    crypto_registry,
+    crypto_registry_pools,
+    populated_base_pool_registry,
+    address_provider,
+    owner,
+):
+    batch_registry = deploy_contract(
+        "CryptoRegistryV1",
+        address_provider,
+        populated_base_pool_registry,
+        directory="registries",
+        sender=owner,
+    )
+    batch_registry.add_pools(
+        [_pool_params(pool) for pool in crypto_registry_pools.values()],
+        sender=owner,
+    )
+
+    pool_count = crypto_registry.pool_count()
+    assert batch_registry.pool_count() == pool_count
+    assert batch_registry.coin_count() == crypto_registry.coin_count()
+
+    for i in range(pool_count):
+        pool = crypto_registry.pool_list(i)
+        assert batch_registry.pool_list(i) == pool
+        assert batch_registry.get_coins(pool) == crypto_registry.get_coins(
+            pool
+        )
+        assert batch_registry.get_lp_token(
+            pool
+        ) == crypto_registry.get_lp_token(pool)
+        assert batch_registry.get_base_pool(
+            pool
+        ) == crypto_registry.get_base_pool(pool)
+
+    for i in range(crypto_registry.coin_count()):
+        coin = crypto_registry.get_coin(i)
+        assert batch_registry.get_coin(i) == coin
+
+
+def test_remove_pools(
+    crypto_registry_pools,
+    populated_base_pool_registry,
+    address_provider,
+    owner,
+    tokens,
+):
+    crypto_registry = deploy_contract(
+        "CryptoRegistryV1",
+        address_provider,
+        populated_base_pool_registry,
+        directory="registries",
+        sender=owner,
+    )
+
+    tricrypto2 = crypto_registry_pools["tricrypto2"]
+    eursusdc = crypto_registry_pools["eursusdc"]
+    crypto_registry.add_pools(
+        [_pool_params(tricrypto2), _pool_params(eursusdc)], sender=owner
+    )
+
+    crypto_registry.remove_pools(
+        [tricrypto2["pool"], eursusdc["pool"]], sender=owner
+    )
+
+    assert crypto_registry.pool_count() == 0
+    assert crypto_registry.coin_count() == 0
+    for pool_data in [tricrypto2, eursusdc]:
+        assert crypto_registry.get_lp_token(pool_data["pool"]) == ZERO_ADDRESS
+        assert (
+            crypto_registry.get_pool_from_lp_token(pool_data["lp_token"])
+            == ZERO_ADDRESS
+        )
+    assert (
+        crypto_registry.find_pool_for_coins(tokens["usdt"], tokens["wbtc"])
+        == ZERO_ADDRESS
+    )
+
+
+def test_add_pools_gas(
+    crypto_registry_pools,
+    populated_base_pool_registry,
+    address_provider,
+    owner,
+):
+    """
+    Benchmark seeding the full crypto registry with a single `add_pools`
+    call against one `add_pool` call per pool.
+    """
+    pools = [_pool_params(pool) for pool in crypto_registry_pools.values()]
+
+    registry = deploy_contract(
+        "CryptoRegistryV1",
+        address_provider,
+        populated_base_pool_registry,
+        directory="registries",
+        sender=owner,
+    )
+    sequential_gas = 0
+    for params in pools:
+        registry.add_pool(*params, sender=owner)
+        sequential_gas += get_last_call_gas_used(registry)
+
+    batch_registry = deploy_contract(
+        "CryptoRegistryV1",
+        address_provider,
+        populated_base_pool_registry,
+        directory="registries",
+        sender=owner,
+    )
+    batch_registry.add_pools(pools, sender=owner)
+    batch_gas = get_last_call_gas_used(batch_registry)
+
+    assert batch_gas < sequential_gas
@@ -0,0 +1,71 @@
+import boa
+import pytest
+from eth.constants import ZERO_ADDRESS
+
+from tests.utils import deploy_contract
+
+IDS = [0, 5, 7, 12, 18]
+
+
+@pytest.fixture(scope="module")
+def address_provider_ng(owner):
+    address_provider = deploy_contract("AddressProviderNG", sender=owner)
+    address_provider.add_new_ids(
+        IDS,
+        [boa.env.generate_address() for _ in IDS],
+        [f"entry {_id}" for _id in IDS],
+        sender=owner,
+    )
+    return address_provider
+
+
+def _get_entry(address_provider, _id):
+    info = address_provider.get_id_info(_id)
+    return (_id, info[0], info[2], info[3])
+
+
+def test_get_addresses(address_provider_ng):
+    ids = [12, 0, 3]
+
+    entries = address_provider_ng.get_addresses(ids)
+
+    assert entries[:2] == [
+        _get_entry(address_provider_ng, _id) for _id in ids[:2]
+    ]
+    assert entries[2] == (3, ZERO_ADDRESS, 0, 0)
+
+
+def test_get_all_entries(address_provider_ng):
+    assert address_provider_ng.ids() == IDS
+    assert address_provider_ng.get_all_entries() == [
+        _get_entry(address_provider_ng, _id) for _id in IDS
+    ]
+
+
+def test_remove_id_from_the_middle(address_provider_ng, owner):
+    with boa.env.anchor():
+        address_provider_ng.remove_id(5, sender=owner)
+
+        # the last id takes the place of the removed one:
+        assert address_provider_ng.ids() == [0, 18, 7, 12]
+        assert address_provider_ng.num_entries() == 4
+        assert not address_provider_ng.check_id_exists(5)
+        assert address_provider_ng.get_address(5) == ZERO_ADDRESS
+        assert address_provider_ng.get_all_entries() == [
+            _get_entry(address_provider_ng, _id) for _id in [0, 18, 7, 12]
+        ]
+
+
+def test_remove_last_id(address_provider_ng, owner):
+    with boa.env.anchor():
+        address_provider_ng.remove_id(18, sender=owner)
+
+        assert address_provider_ng.ids() == IDS[:-1]
+
+
+def test_remove_ids(address_provider_ng, owner):
+    with boa.env.anchor():
+        address_provider_ng.remove_ids([0, 12], sender=owner)
+
+        assert sorted(address_provider_ng.ids()) == [5, 7, 18]
+        assert len(address_provider_ng.get_all_entries()) == 3
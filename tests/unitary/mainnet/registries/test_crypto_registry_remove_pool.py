@@ -0,0 +1,89 @@
+import boa
+from eth.constants import ZERO_ADDRESS
+
+from scripts.utils.constants import ADDRESS_PROVIDER
+from tests.utils import deploy_contract, get_last_call_gas_used
+
+BATCH_SIZE = 20
+
+
+def _deploy_registry_with_market(owner, n_pools):
+    """
+    Deploys a crypto registry where `n_pools` mock pools share a single
+    (coin_a, coin_b) market.
+    """
+    coin_a, coin_b = boa.env.generate_address(), boa.env.generate_address()
+    base_pool_registry = deploy_contract(
+        "BasePoolRegistry", directory="registries", sender=owner
+    )
+    crypto_registry = deploy_contract(
+        "CryptoRegistryV1",
+        ADDRESS_PROVIDER,
+        base_pool_registry,
+        directory="registries",
+        sender=owner,
+    )
+
+    pools = [
+        deploy_contract(
+            "BasePool",
+            [coin_a, coin_b] + [ZERO_ADDRESS] * 6,
+            directory="mocks",
+            sender=owner,
+        ).address
+        for _ in range(n_pools)
+    ]
+    for i in range(0, n_pools, BATCH_SIZE):
+        crypto_registry.add_pools(
+            [
+                (
+                    pool,
+                    boa.env.generate_address(),
+                    ZERO_ADDRESS,
+                    ZERO_ADDRESS,
+                    2,
+                    "mock",
+                    ZERO_ADDRESS,
+                    False,
+                )
+                for pool in pools[i : i + BATCH_SIZE]
+            ],
+            sender=owner,
+        )
+
+    return crypto_registry, coin_a, coin_b, pools
+
+
+def test_remove_pool_keeps_market(owner):
+    crypto_registry, coin_a, coin_b, pools = _deploy_registry_with_market(
+        owner, 5
+    )
+
+    crypto_registry.remove_pool(pools[1], sender=owner)
+
+    # the last pool in the market takes the place of the removed one:
+    remaining = [pools[0], pools[4], pools[2], pools[3]]
+    assert [
+        crypto_registry.find_pool_for_coins(coin_a, coin_b, i)
+        for i in range(len(pools))
+    ] == remaining + [ZERO_ADDRESS]
+
+    # the moved pool can itself be removed:
+    crypto_registry.remove_pool(pools[4], sender=owner)
+    assert [
+        crypto_registry.find_pool_for_coins(coin_a, coin_b, i)
+        for i in range(len(pools) - 1)
+    ] == [pools[0], pools[3], pools[2], ZERO_ADDRESS]
+
+
+def test_remove_pool_gas(owner):
+    gas_used = {}
+    for n_pools in (10, 1000):
+        crypto_registry, _, _, pools = _deploy_registry_with_market(
+            owner, n_pools
+        )
+        # the last pool in the market is the worst case for a linear search:
+        crypto_registry.remove_pool(pools[-1], sender=owner)
+        gas_used[n_pools] = get_last_call_gas_used(crypto_registry)
+
+    assert gas_used[1000] == gas_used[10]
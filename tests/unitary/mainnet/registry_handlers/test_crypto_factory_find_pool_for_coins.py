@@ -0,0 +1,73 @@
+import boa
+import pytest
+from eth.constants import ZERO_ADDRESS
+
+from tests.utils import deploy_contract, get_last_call_gas_used
+
+
+def _deploy_synthetic_factory(owner, n_base_pools):
+    """
+    Deploys a mock crypto factory with a direct pair for (coin_a, coin_b) and
+    one metapool pairing coin_b with the lp token of each base pool holding coin_a.
+    """
+    coin_a, coin_b = boa.env.generate_address(), boa.env.generate_address()
+    base_pool_registry = deploy_contract(
+        "BasePoolRegistry", directory="registries", sender=owner
+    )
+    factory = deploy_contract("CryptoFactory", directory="mocks", sender=owner)
+
+    metapools = []
+    for _ in range(n_base_pools):
+        base_pool = deploy_contract(
+            "BasePool",
+            [coin_a, boa.env.generate_address()] + [ZERO_ADDRESS] * 6,
+            directory="mocks",
+            sender=owner,
+        )
+        lp_token = boa.env.generate_address()
+        base_pool_registry.add_base_pool(
+            base_pool.address, lp_token, 2, False, False, False, sender=owner
+        )
+
+        metapool = boa.env.generate_address()
+        factory.add_pool(
+            metapool, boa.env.generate_address(), [lp_token, coin_b]
+        )
+        metapools.append(metapool)
+
+    direct_pool = boa.env.generate_address()
+    factory.add_pool(direct_pool, boa.env.generate_address(), [coin_a, coin_b])
+
+    handler = deploy_contract(
+        "CryptoFactoryHandler",
+        factory.address,
+        base_pool_registry.address,
+        directory="registry_handlers",
+        sender=owner,
+    )
+    return handler, coin_a, coin_b, [direct_pool] + metapools
+
+
+@pytest.mark.parametrize("n_base_pools", [1, 10, 30])
+def test_find_pool_for_coins(owner, n_base_pools):
+    handler, coin_a, coin_b, pools = _deploy_synthetic_factory(
+        owner, n_base_pools
+    )
+
+    assert [
+        handler.find_pool_for_coins(coin_a, coin_b, i)
+        for i in range(len(pools) + 1)
+    ] == pools + [ZERO_ADDRESS]
+
+
+def test_find_pool_for_coins_gas(owner):
+    gas_used = {}
+    for n_base_pools in (1, 30):
+        handler, coin_a, coin_b, _ = _deploy_synthetic_factory(
+            owner, n_base_pools
+        )
+        handler.find_pool_for_coins(coin_a, coin_b, 1)
+        gas_used[n_base_pools] = get_last_call_gas_used(handler)
+
+    # the first metapool pair is found without enumerating the other base pools:
+    assert gas_used[30] < 2 * gas_used[1]
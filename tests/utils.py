@@ -58,3 +58,11 @@ def assert_negative_coin_balance(metaregistry, pool):
         coin_balance < admin_balance
         for coin_balance, admin_balance in zip(coin_balances, admin_balances)
     )
+
+
+def get_last_call_gas_used(contract: VyperContract) -> int:
+    """
+    Returns the gas used by the last call made to the given contract.
+    :param contract: The contract that was last called.
+    """
+    return contract._computation.get_gas_used()